@@ -1,41 +1,158 @@
 import FreeCAD
 import FreeCADGui
 import ObjectsFem
+import Part
+import Sketcher
 
 import contextlib
-import queue
-import base64
+import functools
+import math
+import socketserver
+import sys
 import io
 import os
 import tempfile
 import threading
 from dataclasses import dataclass, field
+from itertools import islice
 from typing import Any
-from xmlrpc.server import SimpleXMLRPCServer
+from xmlrpc.server import SimpleXMLRPCRequestHandler, SimpleXMLRPCServer
 
-from PySide import QtCore
+from PySide import QtCore, QtGui
 
 from .parts_library import get_parts_list, insert_part_from_library
 from .serialize import serialize_object
 
+try:
+    from femmesh.gmshtools import GmshTools
+except ImportError:
+    GmshTools = None
+
+_Vector = FreeCAD.Vector
+_Placement = FreeCAD.Placement
+_Rotation = FreeCAD.Rotation
+# View providers (ViewObject) only exist when the FreeCAD GUI is running
+_HAS_GUI = bool(getattr(FreeCAD, "GuiUp", False))
+# Shared sketch normal. FreeCAD copies Vector arguments, so it is never mutated.
+_Z_AXIS = _Vector(0, 0, 1)
+
 rpc_server_thread = None
 rpc_server_instance = None
+gui_task_bridge = None
+
+# Seconds a read-only RPC (object queries, screenshots) waits for its GUI task
+# before reporting an error. RPCs that change the document wait until their
+# task is done, however long it takes, so a caller never mistakes work that
+# still commits for a failure.
+GUI_TASK_TIMEOUT = 30.0
+
+
+class _Call:
+    """A GUI task plus the slot its result comes back in."""
+
+    __slots__ = ("fn", "result", "done")
+
+    def __init__(self, fn):
+        self.fn = fn
+        self.result = None
+        self.done = threading.Event()
+
+
+class _KeepAliveRequestHandler(SimpleXMLRPCRequestHandler):
+    """Keeps the client's connection open between calls (HTTP/1.1).
+
+    Headers and body go out as separate writes; with Nagle enabled the body
+    waits for the client's delayed ACK on a reused connection.
+    """
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def handle_one_request(self):
+        super().handle_one_request()
+        # Don't keep serving a kept-alive client once the server is stopped
+        if self.server.stopped:
+            self.close_connection = True
+
+
+class _ThreadedRPCServer(socketserver.ThreadingMixIn, SimpleXMLRPCServer):
+    """Serves each connection on its own thread so readers don't wait on GUI tasks."""
 
-# GUI task queue
-rpc_request_queue = queue.Queue()
-rpc_response_queue = queue.Queue()
+    daemon_threads = True
+    # Restarting on the same port must not fail while old sockets sit in TIME_WAIT
+    allow_reuse_address = True
+    # Set by stop_rpc_server; tells kept-alive handlers to close their connection
+    stopped = False
 
 
-def process_gui_tasks():
-    while not rpc_request_queue.empty():
-        task = rpc_request_queue.get()
-        res = task()
-        if res is not None:
-            rpc_response_queue.put(res)
-    QtCore.QTimer.singleShot(500, process_gui_tasks)
+class _TaskBridge(QtCore.QObject):
+    """Runs _Calls on the GUI thread the bridge was created on.
 
+    Emitting ``run_call`` is thread-safe: the queued connection posts the call
+    to the GUI event loop, so RPC threads hand work over without a relay.
+    """
 
-@dataclass
+    run_call = QtCore.Signal(object)
+
+    def __init__(self):
+        super().__init__()
+        self.run_call.connect(self._run_call, QtCore.Qt.QueuedConnection)
+
+    @QtCore.Slot(object)
+    def _run_call(self, call):
+        try:
+            call.result = call.fn()
+        except Exception as e:
+            # Handlers report errors as strings; never leave a caller waiting
+            call.result = str(e)
+        finally:
+            call.done.set()
+
+
+# ObjectsFem factory per FEM type suffix ("Fem::<suffix>"). Types whose
+# factory is not simply "make<suffix>" are listed up front; the rest are
+# memoized on first use.
+_FEM_MAKE_METHODS: dict[str, Any] = {
+    "MaterialCommon": ObjectsFem.makeMaterialSolid,
+    "AnalysisPython": ObjectsFem.makeAnalysis,
+}
+
+
+def dispatch_gui(fn, timeout: float | None = None):
+    """Run ``fn`` on the GUI thread and return its result.
+
+    Returns an error string if the GUI thread has not finished the task within
+    ``timeout`` seconds (None waits indefinitely). The task still runs when
+    the GUI thread gets to it; only its result is dropped.
+    """
+    bridge = gui_task_bridge
+    if bridge is None:
+        return "RPC server is not running"
+    call = _Call(fn)
+    bridge.run_call.emit(call)
+    if not call.done.wait(timeout):
+        return (
+            f"GUI thread did not respond within {timeout:g}s; "
+            "the task is still queued and will run"
+        )
+    return call.result
+
+
+def read_gui(fn):
+    """Run a read-only ``fn`` on the GUI thread with GUI_TASK_TIMEOUT.
+
+    Readers return lists, dicts or None, never strings, so a string result is
+    dispatch_gui's error (timeout, server stopped, or an exception in ``fn``).
+    It is raised so the client gets an XML-RPC fault instead of a string where
+    it expects data.
+    """
+    res = dispatch_gui(fn, timeout=GUI_TASK_TIMEOUT)
+    if isinstance(res, str):
+        raise RuntimeError(res)
+    return res
+
+
+@dataclass(slots=True)
 class Object:
     name: str
     type: str | None = None
@@ -43,49 +160,459 @@ class Object:
     properties: dict[str, Any] = field(default_factory=dict)
 
 
+def object_from_data(obj_data: dict[str, Any]) -> Object:
+    return Object(
+        name=obj_data.get("Name", "New_Object"),
+        type=obj_data["Type"],
+        analysis=obj_data.get("Analysis", None),
+        properties=obj_data.get("Properties", {}),
+    )
+
+
+def box_data(
+    name: str,
+    length: float,
+    width: float,
+    height: float,
+    position: dict[str, float] | list[float] = None,
+    color: list[float] = None
+) -> dict[str, Any]:
+    """Build the create_object payload for a Part::Box"""
+    obj_data = {
+        "Name": name,
+        "Type": "Part::Box",
+        "Properties": {
+            "Length": length,
+            "Width": width,
+            "Height": height
+        }
+    }
+
+    if position:
+        obj_data["Properties"]["Placement"] = {"Base": position}
+
+    if color:
+        obj_data["Properties"]["ViewObject"] = {
+            "ShapeColor": color
+        }
+
+    return obj_data
+
+
+def cylinder_data(
+    name: str,
+    radius: float,
+    height: float,
+    position: dict[str, float] | list[float] = None,
+    direction: dict[str, float] = None,
+    color: list[float] = None
+) -> dict[str, Any]:
+    """Build the create_object payload for a Part::Cylinder"""
+    obj_data = {
+        "Name": name,
+        "Type": "Part::Cylinder",
+        "Properties": {
+            "Radius": radius,
+            "Height": height
+        }
+    }
+
+    if position or direction:
+        placement = {"Base": position or (0, 0, 0)}
+
+        if direction:
+            # Calculate rotation from direction vector
+            # For now, just store the direction - FreeCAD will handle rotation
+            placement["Rotation"] = {
+                "Axis": {"x": direction.get("x", 0), "y": direction.get("y", 0), "z": direction.get("z", 1)},
+                "Angle": 0
+            }
+
+        obj_data["Properties"]["Placement"] = placement
+
+    if color:
+        obj_data["Properties"]["ViewObject"] = {
+            "ShapeColor": color
+        }
+
+    return obj_data
+
+
+def ensure_recomputed(*objs):
+    """Recompute objects whose shape is still pending (e.g. created in a batch)"""
+    for obj in objs:
+        if obj.mustExecute():
+            obj.recompute()
+
+
+def recompute_moved(doc: FreeCAD.Document, moved: list) -> None:
+    """Recompute after changing the Placement of ``moved``.
+
+    Document.recompute(objs) covers the listed objects and what they depend
+    on, not the features built on them (Cut, Pad, Array, ...). The scoped form
+    is only used when nothing depends on a moved object; otherwise the whole
+    document is recomputed.
+    """
+    if not moved:
+        return
+    if any(obj.InList for obj in moved):
+        doc.recompute()
+    else:
+        doc.recompute(moved)
+
+
+def _xyz(p: dict[str, float] | list[float] | None, z: float = 0.0) -> tuple[float, float, float]:
+    """Coordinates from an {x, y, z} dict or an [x, y, z] array.
+
+    Missing dict keys default to 0 (``z`` for the z key); None is the origin.
+    """
+    if p is None:
+        return (0.0, 0.0, z)
+    if isinstance(p, dict):
+        return (p.get("x", 0.0), p.get("y", 0.0), p.get("z", z))
+    x, y, z = p
+    return (x, y, z)
+
+
+def _vec(p: dict[str, float] | list[float], z: float = 0.0) -> FreeCAD.Vector:
+    return _Vector(*_xyz(p, z))
+
+
+def _parse_placement(val: dict[str, Any]) -> FreeCAD.Placement:
+    """Build a Placement from a {"Base"|"Position", "Rotation"} dict."""
+    pos = val.get("Base") or val.get("Position")
+    rot = val.get("Rotation")
+    if not pos and not rot:
+        return _Placement()
+    if not rot:
+        return _Placement(_vec(pos), _Rotation())
+    axis = rot.get("Axis")
+    return _Placement(
+        _vec(pos) if pos else _Vector(),
+        _Rotation(
+            _vec(axis, 1.0) if axis else _Z_AXIS,
+            rot.get("Angle", 0),
+        ),
+    )
+
+
+def grab_view_image(view):
+    """Render a 3D view, as a QImage when its viewer supports grabbing it.
+
+    ``grabFramebuffer`` lives on the Qt viewer behind the View3DInventor, not
+    on the view itself. Views without one are saved through a temporary file
+    and come back as PNG bytes instead.
+    """
+    get_viewer = getattr(view, "getViewer", None)
+    viewer = get_viewer() if get_viewer is not None else None
+    grab = getattr(viewer, "grabFramebuffer", None)
+    if grab is not None:
+        return grab()
+
+    fd, tmp_path = tempfile.mkstemp(suffix=".png")
+    os.close(fd)
+    try:
+        view.saveImage(tmp_path, 1)
+        with open(tmp_path, "rb") as image_file:
+            return image_file.read()
+    finally:
+        os.remove(tmp_path)
+
+
+def scale_to_fit(image, max_dim: int):
+    """Shrink a QImage so neither side exceeds ``max_dim``, keeping its aspect."""
+    if image.width() <= max_dim and image.height() <= max_dim:
+        return image
+    return image.scaled(
+        max_dim, max_dim, QtCore.Qt.KeepAspectRatio, QtCore.Qt.SmoothTransformation
+    )
+
+
+# Qt writer and quality (-1 = Qt default) for each screenshot format
+_IMAGE_FORMATS = {
+    "png": ("PNG", -1),
+    "jpeg": ("JPG", 80),
+}
+
+
+def encode_image(image, image_format: str = "png") -> bytes:
+    """Encode a QImage as PNG or JPEG. QImage is safe to use off the GUI thread."""
+    writer, quality = _IMAGE_FORMATS[image_format]
+    buf = QtCore.QBuffer()
+    buf.open(QtCore.QIODevice.WriteOnly)
+    image.save(buf, writer, quality)
+    return bytes(buf.data())
+
+
+# View3DInventor method that orients the camera for each screenshot view name
+_VIEW_METHODS = {
+    "Isometric": "viewIsometric",
+    "Front": "viewFront",
+    "Top": "viewTop",
+    "Right": "viewRight",
+    "Back": "viewBack",
+    "Left": "viewLeft",
+    "Bottom": "viewBottom",
+    "Dimetric": "viewDimetric",
+    "Trimetric": "viewTrimetric",
+}
+
+
+def available_objects_hint(doc: FreeCAD.Document, limit: int = 10) -> str:
+    """Labels of the first ``limit`` objects in ``doc``, for error messages."""
+    objs = doc.Objects
+    labels = ", ".join(obj.Label for obj in islice(objs, limit))
+    return labels + ("..." if len(objs) > limit else "")
+
+
+# Sketch plane orientations. Placement() copies the rotation, so these are
+# never modified.
+_PLANE_ROTATIONS = {
+    "XY": _Rotation(_Z_AXIS, 0),  # Default - no rotation needed
+    "XZ": _Rotation(_Vector(1, 0, 0), 90),  # Rotate 90° around X axis
+    "YZ": _Rotation(_Vector(0, 1, 0), -90),  # Rotate 90° around Y axis
+}
+
+# 2020 profile orientation per extrusion direction: the cross-section lies in
+# the plane normal to it. Simplified boxes stay axis-aligned ("Z").
+_EXTRUSION_ROTATIONS = {
+    "Z": _PLANE_ROTATIONS["XY"],
+    "Y": _PLANE_ROTATIONS["XZ"],
+    "X": _PLANE_ROTATIONS["YZ"],
+}
+
+
+def _normalize_2020_args(direction: str, profile_variant: str) -> tuple[str, str]:
+    """Upper-case and validate a 2020 extrusion's direction and variant name.
+
+    Raises:
+        ValueError: If ``direction`` is not X, Y or Z.
+    """
+    direction = direction.upper()
+    if direction not in _EXTRUSION_ROTATIONS:
+        raise ValueError(f"Invalid direction '{direction}'. Use 'X', 'Y', or 'Z'.")
+    return direction, profile_variant.upper().replace("-", "")
+
+
+# Degrees to radians
+_DEG = math.pi / 180.0
+
+
+def _sketch_line(geom: dict[str, Any]):
+    line = Part.LineSegment(
+        _Vector(geom.get("x1", 0), geom.get("y1", 0), 0),
+        _Vector(geom.get("x2", 0), geom.get("y2", 0), 0)
+    )
+    return [line], ()
+
+
+# Rectangle edge i ends (point 2) where edge i+1 starts (point 1)
+_RECTANGLE_JOINS = tuple((i, 2, (i + 1) % 4, 1) for i in range(4))
+
+
+def _sketch_rectangle(geom: dict[str, Any]):
+    x = geom.get("x", 0)
+    y = geom.get("y", 0)
+    w = geom.get("width", 10)
+    h = geom.get("height", 10)
+    corners = [
+        _Vector(x, y, 0),
+        _Vector(x + w, y, 0),
+        _Vector(x + w, y + h, 0),
+        _Vector(x, y + h, 0),
+    ]
+    lines = [Part.LineSegment(corners[i], corners[(i + 1) % 4]) for i in range(4)]
+    return lines, _RECTANGLE_JOINS
+
+
+def _sketch_circle(geom: dict[str, Any]):
+    circle = Part.Circle(
+        _Vector(geom.get("cx", 0), geom.get("cy", 0), 0),
+        _Z_AXIS,
+        geom.get("radius", 5)
+    )
+    return [circle], ()
+
+
+def _sketch_arc(geom: dict[str, Any]):
+    circle = Part.Circle(
+        _Vector(geom.get("cx", 0), geom.get("cy", 0), 0),
+        _Z_AXIS,
+        geom.get("radius", 5)
+    )
+    arc = Part.ArcOfCircle(
+        circle,
+        geom.get("start_angle", 0) * _DEG,
+        geom.get("end_angle", 90) * _DEG
+    )
+    return [arc], ()
+
+
+# add_sketch_geometry builders by type. Each returns the Part geometries and
+# (edge, point, edge, point) Coincident joins relative to its first edge.
+_GEOM_BUILDERS = {
+    "line": _sketch_line,
+    "rectangle": _sketch_rectangle,
+    "circle": _sketch_circle,
+    "arc": _sketch_arc,
+}
+
+# Sketcher constraint name and (key, default) argument fields per request
+# type. Symmetric additionally takes the axis id, appended by the handler.
+_CONSTRAINT_ARGS = {
+    "horizontal": ("Horizontal", (("geometry_id", 0),)),
+    "vertical": ("Vertical", (("geometry_id", 0),)),
+    "coincident": ("Coincident", (("id1", 0), ("point1", 2), ("id2", 1), ("point2", 1))),
+    "distance": ("Distance", (("geometry_id", 0), ("value", 10.0))),
+    "radius": ("Radius", (("geometry_id", 0), ("value", 5.0))),
+    "equal": ("Equal", (("id1", 0), ("id2", 1))),
+    "perpendicular": ("Perpendicular", (("id1", 0), ("id2", 1))),
+    "parallel": ("Parallel", (("id1", 0), ("id2", 1))),
+    "fix": ("Fixed", (("geometry_id", 0), ("point", 1))),
+    "symmetric": ("Symmetric", (("id1", 0), ("point1", 1), ("id2", 0), ("point2", 2))),
+}
+
+# 2020 cross-sections keyed by (variant, sealed_rotation). They depend only
+# on the key, so each one is built once and copied for every extrusion.
+_PROFILE_FACE_CACHE: dict[tuple[str, int], Any] = {}
+
+
+def _build_2020_face(variant: str, sealed_rotation: int):
+    """Build the 2D cross-section of a detailed 2020 profile in the XY plane."""
+    # 2020 profile dimensions (from 2020N2 spec):
+    # - 20x20mm outer
+    # - 6.1mm slot opening
+    # - 11mm T-track width
+    # - 5mm center bore
+    # - 1.5mm corner radius
+    size = 20.0
+    half = size / 2.0
+    slot_opening = 6.1  # Slot opening width
+    slot_depth = 1.8    # Depth to T-track
+    track_width = 11.0  # Internal T-track width
+    track_depth = 6.0   # Total slot depth from surface
+    bore_r = 2.5        # Center bore radius
+    corner_r = 1.5      # Corner radius
+    wall_t = 1.5        # Wall thickness
+
+    # Determine which sides have slots based on variant
+    # Sides: 0=bottom (-Y), 1=right (+X), 2=top (+Y), 3=left (-X)
+    if variant == "2020":
+        slot_sides = [0, 1, 2, 3]  # All 4 sides have slots
+    elif variant == "2020N1":
+        # 1 sealed, 3 slots - sealed side rotated by sealed_rotation
+        sealed_side = (sealed_rotation // 90) % 4
+        slot_sides = [s for s in [0, 1, 2, 3] if s != sealed_side]
+    elif variant == "2020N2":
+        # 2 adjacent sealed, 2 slots - forms a corner
+        base = (sealed_rotation // 90) % 4
+        sealed_sides = [base, (base + 1) % 4]
+        slot_sides = [s for s in [0, 1, 2, 3] if s not in sealed_sides]
+    elif variant == "2020N3":
+        # 3 sealed, 1 slot - only one side has slot
+        slot_side = (sealed_rotation // 90) % 4
+        slot_sides = [slot_side]
+    else:
+        # Default to full 2020
+        slot_sides = [0, 1, 2, 3]
+
+    def rect_wire(x, y, w, h):
+        return Part.makePolygon([
+            FreeCAD.Vector(x, y, 0),
+            FreeCAD.Vector(x + w, y, 0),
+            FreeCAD.Vector(x + w, y + h, 0),
+            FreeCAD.Vector(x, y + h, 0),
+            FreeCAD.Vector(x, y, 0)
+        ])
+
+    def rect_face(x, y, w, h):
+        return Part.Face(rect_wire(x, y, w, h))
+
+    # Outer square with the center bore as a hole
+    outer_face = Part.Face(
+        [rect_wire(-half, -half, size, size), Part.Wire(Part.makeCircle(bore_r))],
+        "Part::FaceMakerBullseye"
+    )
+
+    cutouts = []
+
+    # T-slots on active sides
+    slot_half = slot_opening / 2.0
+    track_half = track_width / 2.0
+    track_h = track_depth - slot_depth
+
+    for side in slot_sides:
+        # T-slot: narrow opening, wider track inside
+        if side == 0:  # Bottom (-Y)
+            cutouts += [
+                rect_face(-slot_half, -half, slot_opening, slot_depth),
+                rect_face(-track_half, -half + slot_depth, track_width, track_h),
+            ]
+        elif side == 1:  # Right (+X)
+            cutouts += [
+                rect_face(half - slot_depth, -slot_half, slot_depth, slot_opening),
+                rect_face(half - track_depth, -track_half, track_h, track_width),
+            ]
+        elif side == 2:  # Top (+Y)
+            cutouts += [
+                rect_face(-slot_half, half - slot_depth, slot_opening, slot_depth),
+                rect_face(-track_half, half - track_depth, track_width, track_h),
+            ]
+        elif side == 3:  # Left (-X)
+            cutouts += [
+                rect_face(-half, -slot_half, slot_depth, slot_opening),
+                rect_face(-half, -track_half, track_h, track_width),
+            ]
+
+    # One 2D boolean for all cutouts
+    return outer_face.cut(cutouts)
+
+
+@functools.lru_cache(maxsize=128)
+def compile_code(code: str):
+    """Compile execute_code source, reusing the code object for repeated scripts."""
+    return compile(code, "<rpc>", "exec")
+
+
+class ObjectLookup(dict):
+    """Per-call memo of ``doc.getObject`` results, keyed by object name.
+
+    Missing names resolve to None. Build a fresh one for every GUI task so it
+    never outlives objects added or removed by other calls.
+    """
+
+    __slots__ = ("doc",)
+
+    def __init__(self, doc: FreeCAD.Document):
+        super().__init__()
+        self.doc = doc
+
+    def __missing__(self, name: str):
+        obj = self[name] = self.doc.getObject(name)
+        return obj
+
+
 def set_object_property(
-    doc: FreeCAD.Document, obj: FreeCAD.DocumentObject, properties: dict[str, Any]
+    objects: ObjectLookup, obj: FreeCAD.DocumentObject, properties: dict[str, Any]
 ):
+    # Both are fetched from the C++ side on every access; read them once.
+    prop_names = frozenset(obj.PropertiesList)
+    view_obj = getattr(obj, "ViewObject", None)
     for prop, val in properties.items():
         try:
-            if prop in obj.PropertiesList:
+            if prop in prop_names:
                 if prop == "Placement" and isinstance(val, dict):
-                    if "Base" in val:
-                        pos = val["Base"]
-                    elif "Position" in val:
-                        pos = val["Position"]
-                    else:
-                        pos = {}
-                    rot = val.get("Rotation", {})
-                    placement = FreeCAD.Placement(
-                        FreeCAD.Vector(
-                            pos.get("x", 0),
-                            pos.get("y", 0),
-                            pos.get("z", 0),
-                        ),
-                        FreeCAD.Rotation(
-                            FreeCAD.Vector(
-                                rot.get("Axis", {}).get("x", 0),
-                                rot.get("Axis", {}).get("y", 0),
-                                rot.get("Axis", {}).get("z", 1),
-                            ),
-                            rot.get("Angle", 0),
-                        ),
-                    )
-                    setattr(obj, prop, placement)
+                    setattr(obj, prop, _parse_placement(val))
 
-                elif isinstance(getattr(obj, prop), FreeCAD.Vector) and isinstance(
-                    val, dict
+                elif isinstance(val, dict) and isinstance(
+                    getattr(obj, prop), _Vector
                 ):
-                    vector = FreeCAD.Vector(
-                        val.get("x", 0), val.get("y", 0), val.get("z", 0)
-                    )
-                    setattr(obj, prop, vector)
+                    setattr(obj, prop, _vec(val))
 
                 elif prop in ["Base", "Tool", "Source", "Profile"] and isinstance(
                     val, str
                 ):
-                    ref_obj = doc.getObject(val)
+                    ref_obj = objects[val]
                     if ref_obj:
                         setattr(obj, prop, ref_obj)
                     else:
@@ -94,7 +621,7 @@ def set_object_property(
                 elif prop == "References" and isinstance(val, list):
                     refs = []
                     for ref_name, face in val:
-                        ref_obj = doc.getObject(ref_name)
+                        ref_obj = objects[ref_name]
                         if ref_obj:
                             refs.append((ref_obj, face))
                         else:
@@ -105,14 +632,14 @@ def set_object_property(
                     setattr(obj, prop, val)
             # ShapeColor is a property of the ViewObject
             elif prop == "ShapeColor" and isinstance(val, (list, tuple)):
-                setattr(obj.ViewObject, prop, (float(val[0]), float(val[1]), float(val[2]), float(val[3])))
+                setattr(view_obj, prop, (float(val[0]), float(val[1]), float(val[2]), float(val[3])))
 
             elif prop == "ViewObject" and isinstance(val, dict):
                 for k, v in val.items():
                     if k == "ShapeColor":
-                        setattr(obj.ViewObject, k, (float(v[0]), float(v[1]), float(v[2]), float(v[3])))
+                        setattr(view_obj, k, (float(v[0]), float(v[1]), float(v[2]), float(v[3])))
                     else:
-                        setattr(obj.ViewObject, k, v)
+                        setattr(view_obj, k, v)
 
             else:
                 setattr(obj, prop, val)
@@ -121,60 +648,133 @@ def set_object_property(
             FreeCAD.Console.PrintError(f"Property '{prop}' assignment error: {e}\n")
 
 
+# Only ping, list_documents and get_parts_list run directly on the XML-RPC
+# thread. They read the document list or the parts library, never a document's
+# objects. Every other RPC, including those that only walk doc.Objects (which
+# GUI tasks may be changing) or call serialize_object (which reads
+# ViewObject), must go through dispatch_gui.
+
+
 class FreeCADRPC:
     """RPC server for FreeCAD"""
 
+    def __init__(self):
+        # Globals for execute_code. Persist across calls so scripts can build
+        # on names defined by earlier ones.
+        self._exec_ns = {
+            "__name__": "__rpc__",
+            "FreeCAD": FreeCAD,
+            "FreeCADGui": FreeCADGui,
+            "ObjectsFem": ObjectsFem,
+        }
+        # Names of installed workbenches; filled on first use by _has_workbench.
+        self._wb_cache = None
+        # GUI-thread handlers usable from execute_batch, keyed by RPC method name.
+        # Each takes the document name plus the RPC method's remaining arguments.
+        self._method_map = {
+            "create_object": lambda doc_name, obj_data: self._batch_create_object(
+                doc_name, obj_data
+            ),
+            "edit_object": lambda doc_name, obj_name, properties: self._edit_object_gui(
+                doc_name,
+                Object(name=obj_name, properties=properties.get("Properties", {})),
+                defer_recompute=True,
+            ),
+            "delete_object": lambda doc_name, obj_name: self._delete_object_gui(
+                doc_name, obj_name, defer_recompute=True
+            ),
+            "boolean_operation": lambda doc_name, **kwargs: self._boolean_operation_gui(
+                doc_name, defer_recompute=True, **kwargs
+            ),
+            "create_box": lambda doc_name, **kwargs: self._batch_create_object(
+                doc_name, box_data(**kwargs)
+            ),
+            "create_cylinder": lambda doc_name, **kwargs: self._batch_create_object(
+                doc_name, cylinder_data(**kwargs)
+            ),
+            "create_fastener": lambda doc_name, **kwargs: self._create_fastener_gui(
+                doc_name, defer_recompute=True, **kwargs
+            ),
+            "create_2020_extrusion": lambda doc_name, **kwargs: self._batch_2020_extrusion(
+                doc_name, **kwargs
+            ),
+        }
+        # Bound public methods by name, so _dispatch skips the server's
+        # per-call getattr walk. Underscore names are never exposed.
+        self._dispatch_table = {
+            name: getattr(self, name)
+            for name in dir(type(self))
+            if not name.startswith("_") and callable(getattr(type(self), name))
+        }
+
+    def _dispatch(self, method, params):
+        """Called by SimpleXMLRPCServer for every method not registered on it."""
+        fn = self._dispatch_table.get(method)
+        if fn is None:
+            raise Exception(f'method "{method}" is not supported')
+        return fn(*params)
+
     def ping(self):
         return True
 
     def create_document(self, name="New_Document"):
-        rpc_request_queue.put(lambda: self._create_document_gui(name))
-        res = rpc_response_queue.get()
+        res = dispatch_gui(lambda: self._create_document_gui(name))
         if res is True:
             return {"success": True, "document_name": name}
         else:
             return {"success": False, "error": res}
 
-    def create_object(self, doc_name, obj_data: dict[str, Any]):
-        obj = Object(
-            name=obj_data.get("Name", "New_Object"),
-            type=obj_data["Type"],
-            analysis=obj_data.get("Analysis", None),
-            properties=obj_data.get("Properties", {}),
-        )
-        rpc_request_queue.put(lambda: self._create_object_gui(doc_name, obj))
-        res = rpc_response_queue.get()
+    def create_object(self, doc_name, obj_data: dict[str, Any], defer_recompute: bool = False):
+        obj = object_from_data(obj_data)
+        res = dispatch_gui(lambda: self._create_object_gui(doc_name, obj, defer_recompute))
         if res is True:
             return {"success": True, "object_name": obj.name}
         else:
             return {"success": False, "error": res}
 
-    def edit_object(self, doc_name: str, obj_name: str, properties: dict[str, Any]) -> dict[str, Any]:
+    def edit_object(
+        self,
+        doc_name: str,
+        obj_name: str,
+        properties: dict[str, Any],
+        defer_recompute: bool = False
+    ) -> dict[str, Any]:
         obj = Object(
             name=obj_name,
             properties=properties.get("Properties", {}),
         )
-        rpc_request_queue.put(lambda: self._edit_object_gui(doc_name, obj))
-        res = rpc_response_queue.get()
+        res = dispatch_gui(lambda: self._edit_object_gui(doc_name, obj, defer_recompute))
         if res is True:
             return {"success": True, "object_name": obj.name}
         else:
             return {"success": False, "error": res}
 
-    def delete_object(self, doc_name: str, obj_name: str):
-        rpc_request_queue.put(lambda: self._delete_object_gui(doc_name, obj_name))
-        res = rpc_response_queue.get()
+    def delete_object(self, doc_name: str, obj_name: str, defer_recompute: bool = False):
+        res = dispatch_gui(
+            lambda: self._delete_object_gui(doc_name, obj_name, defer_recompute)
+        )
         if res is True:
             return {"success": True, "object_name": obj_name}
         else:
             return {"success": False, "error": res}
 
-    def execute_code(self, code: str) -> dict[str, Any]:
-        output_buffer = io.StringIO()
+    def execute_code(self, code: str, capture_stdout: bool = True) -> dict[str, Any]:
+        """Execute Python code on the GUI thread.
+
+        Args:
+            code: The Python source to run
+            capture_stdout: Return anything the code prints in the message.
+                Callers that don't need the output can pass False to skip
+                redirecting stdout.
+        """
+        output_buffer = io.StringIO() if capture_stdout else None
         def task():
             try:
-                with contextlib.redirect_stdout(output_buffer):
-                    exec(code, globals())
+                if output_buffer is None:
+                    exec(compile_code(code), self._exec_ns)
+                else:
+                    with contextlib.redirect_stdout(output_buffer):
+                        exec(compile_code(code), self._exec_ns)
                 FreeCAD.Console.PrintMessage("Python code executed successfully.\n")
                 return True
             except Exception as e:
@@ -183,9 +783,10 @@ class FreeCADRPC:
                 )
                 return f"Error executing Python code: {e}\n"
 
-        rpc_request_queue.put(task)
-        res = rpc_response_queue.get()
+        res = dispatch_gui(task)
         if res is True:
+            if output_buffer is None:
+                return {"success": True, "message": "Python code executed successfully."}
             return {
                 "success": True,
                 "message": "Python code execution scheduled. \nOutput: " + output_buffer.getvalue()
@@ -193,23 +794,37 @@ class FreeCADRPC:
         else:
             return {"success": False, "error": res}
 
-    def get_objects(self, doc_name):
-        doc = FreeCAD.getDocument(doc_name)
-        if doc:
-            return [serialize_object(obj) for obj in doc.Objects]
+    def recompute(self, doc_name: str) -> dict[str, Any]:
+        """Recompute a document.
+
+        Scripted workflows that pass defer_recompute=True to a series of calls
+        should call this once at the end.
+        """
+        res = dispatch_gui(lambda: self._recompute_gui(doc_name))
+        if res is True:
+            return {"success": True, "document_name": doc_name}
         else:
-            return []
+            return {"success": False, "error": res}
+
+    def get_objects(self, doc_name):
+        """Serialize every object in the document.
+
+        Deprecated: prefer get_objects_names, or get_objects_page for
+        large documents.
+        """
+        return read_gui(lambda: self._get_objects_gui(doc_name))
+
+    def get_objects_names(self, doc_name):
+        return read_gui(lambda: self._get_objects_names_gui(doc_name))
+
+    def get_objects_page(self, doc_name, offset=0, limit=100):
+        return read_gui(lambda: self._get_objects_gui(doc_name, offset, limit))
 
     def get_object(self, doc_name, obj_name):
-        doc = FreeCAD.getDocument(doc_name)
-        if doc:
-            return serialize_object(doc.getObject(obj_name))
-        else:
-            return None
+        return read_gui(lambda: self._get_object_gui(doc_name, obj_name))
 
     def insert_part_from_library(self, relative_path):
-        rpc_request_queue.put(lambda: self._insert_part_from_library(relative_path))
-        res = rpc_response_queue.get()
+        res = dispatch_gui(lambda: self._insert_part_from_library(relative_path))
         if res is True:
             return {"success": True, "message": "Part inserted from library."}
         else:
@@ -230,8 +845,7 @@ class FreeCADRPC:
         Returns:
             Success status and workbench information
         """
-        rpc_request_queue.put(lambda: self._activate_workbench_gui(workbench_name))
-        res = rpc_response_queue.get()
+        res = dispatch_gui(lambda: self._activate_workbench_gui(workbench_name))
         if res is True:
             return {
                 "success": True,
@@ -248,7 +862,8 @@ class FreeCADRPC:
         base_obj_name: str,
         tool_obj_name: str,
         result_name: str = None,
-        keep_originals: bool = False
+        keep_originals: bool = False,
+        defer_recompute: bool = False
     ) -> dict[str, Any]:
         """Perform boolean operation between two objects.
 
@@ -259,16 +874,17 @@ class FreeCADRPC:
             tool_obj_name: Second object name
             result_name: Name for result object (auto-generated if None)
             keep_originals: If True, keep original objects
+            defer_recompute: If True, skip the document recompute (call recompute() later)
 
         Returns:
             Success status and result object name
         """
-        rpc_request_queue.put(
+        res = dispatch_gui(
             lambda: self._boolean_operation_gui(
-                doc_name, operation, base_obj_name, tool_obj_name, result_name, keep_originals
+                doc_name, operation, base_obj_name, tool_obj_name, result_name, keep_originals,
+                defer_recompute
             )
         )
-        res = rpc_response_queue.get()
         if isinstance(res, str):
             return {"success": False, "error": res}
         else:
@@ -281,8 +897,9 @@ class FreeCADRPC:
         length: float,
         width: float,
         height: float,
-        position: dict[str, float] = None,
-        color: list[float] = None
+        position: dict[str, float] | list[float] = None,
+        color: list[float] = None,
+        defer_recompute: bool = False
     ) -> dict[str, Any]:
         """Create a box with simplified parameters.
 
@@ -292,33 +909,16 @@ class FreeCADRPC:
             length: Box length (X dimension)
             width: Box width (Y dimension)
             height: Box height (Z dimension)
-            position: Optional position dict with x, y, z keys
+            position: Optional position, {x, y, z} dict or [x, y, z] array
             color: Optional RGBA color [R, G, B, A] (0.0-1.0)
+            defer_recompute: If True, skip the document recompute (call recompute() later)
 
         Returns:
             Success status and object name
         """
-        obj_data = {
-            "Name": name,
-            "Type": "Part::Box",
-            "Properties": {
-                "Length": length,
-                "Width": width,
-                "Height": height
-            }
-        }
-
-        if position:
-            obj_data["Properties"]["Placement"] = {
-                "Base": {"x": position.get("x", 0), "y": position.get("y", 0), "z": position.get("z", 0)}
-            }
-
-        if color:
-            obj_data["Properties"]["ViewObject"] = {
-                "ShapeColor": color
-            }
-
-        return self.create_object(doc_name, obj_data)
+        return self.create_object(
+            doc_name, box_data(name, length, width, height, position, color), defer_recompute
+        )
 
     def create_cylinder(
         self,
@@ -326,9 +926,10 @@ class FreeCADRPC:
         name: str,
         radius: float,
         height: float,
-        position: dict[str, float] = None,
+        position: dict[str, float] | list[float] = None,
         direction: dict[str, float] = None,
-        color: list[float] = None
+        color: list[float] = None,
+        defer_recompute: bool = False
     ) -> dict[str, Any]:
         """Create a cylinder with simplified parameters.
 
@@ -337,55 +938,28 @@ class FreeCADRPC:
             name: Object name
             radius: Cylinder radius
             height: Cylinder height
-            position: Optional position dict with x, y, z keys
+            position: Optional position, {x, y, z} dict or [x, y, z] array
             direction: Optional direction dict with x, y, z keys (default: Z-axis)
             color: Optional RGBA color [R, G, B, A] (0.0-1.0)
+            defer_recompute: If True, skip the document recompute (call recompute() later)
 
         Returns:
             Success status and object name
         """
-        obj_data = {
-            "Name": name,
-            "Type": "Part::Cylinder",
-            "Properties": {
-                "Radius": radius,
-                "Height": height
-            }
-        }
-
-        if position or direction:
-            placement = {"Base": {}}
-            if position:
-                placement["Base"] = {"x": position.get("x", 0), "y": position.get("y", 0), "z": position.get("z", 0)}
-            else:
-                placement["Base"] = {"x": 0, "y": 0, "z": 0}
-
-            if direction:
-                # Calculate rotation from direction vector
-                # For now, just store the direction - FreeCAD will handle rotation
-                placement["Rotation"] = {
-                    "Axis": {"x": direction.get("x", 0), "y": direction.get("y", 0), "z": direction.get("z", 1)},
-                    "Angle": 0
-                }
-
-            obj_data["Properties"]["Placement"] = placement
-
-        if color:
-            obj_data["Properties"]["ViewObject"] = {
-                "ShapeColor": color
-            }
-
-        return self.create_object(doc_name, obj_data)
+        return self.create_object(
+            doc_name, cylinder_data(name, radius, height, position, direction, color), defer_recompute
+        )
 
     def create_fastener(
         self,
         doc_name: str,
         name: str,
         fastener_type: str,
-        position: dict[str, float] = None,
+        position: dict[str, float] | list[float] = None,
         attach_to: str = None,
         diameter: str = "M4",
-        length: str = "10"
+        length: str = "10",
+        defer_recompute: bool = False
     ) -> dict[str, Any]:
         """Create a fastener using FastenersWorkbench.
 
@@ -393,20 +967,21 @@ class FreeCADRPC:
             doc_name: Document name
             name: Object name for the fastener
             fastener_type: Fastener type (e.g., "DIN464", "ISO4017", "DIN912")
-            position: Optional position dict with x, y, z keys
+            position: Optional position, {x, y, z} dict or [x, y, z] array
             attach_to: Optional object name to attach fastener to
             diameter: Fastener diameter (e.g., "M3", "M4", "M5", "M6")
             length: Fastener length in mm (as string)
+            defer_recompute: If True, skip the document recompute (call recompute() later)
 
         Returns:
             Success status and object name
         """
-        rpc_request_queue.put(
+        res = dispatch_gui(
             lambda: self._create_fastener_gui(
-                doc_name, name, fastener_type, position, attach_to, diameter, length
+                doc_name, name, fastener_type, position, attach_to, diameter, length,
+                defer_recompute
             )
         )
-        res = rpc_response_queue.get()
         if isinstance(res, str):
             return {"success": False, "error": res}
         else:
@@ -418,56 +993,81 @@ class FreeCADRPC:
                 "message": res["message"]
             }
 
-    def get_active_screenshot(self, view_name: str = "Isometric") -> str:
+    def execute_batch(self, doc_name: str, calls: list[dict[str, Any]]) -> dict[str, Any]:
+        """Run several operations on one document in a single GUI task.
+
+        All calls share one transaction and the document is recomputed once at
+        the end instead of after every call.
+
+        Args:
+            doc_name: Document name
+            calls: List of {"method": ..., "args": {...}} items. ``method`` is one of
+                create_object, edit_object, delete_object, boolean_operation,
+                create_box, create_cylinder, create_fastener or
+                create_2020_extrusion; ``args`` holds that method's keyword
+                arguments without ``doc_name``.
+
+        Returns:
+            Success status and one {"success": ...} result per call, in order
+        """
+        res = dispatch_gui(lambda: self._execute_batch_gui(doc_name, calls))
+        if isinstance(res, str):
+            return {"success": False, "error": res}
+        return {"success": True, "results": res["results"]}
+
+    def get_active_screenshot(
+        self, view_name: str = "Isometric", max_dim: int = 0, image_format: str = "png"
+    ) -> bytes | None:
         """Get a screenshot of the active view.
 
-        Returns a base64-encoded string of the screenshot or None if a screenshot
+        Args:
+            view_name: Camera orientation to capture from
+            max_dim: If set, scale the image down so neither side exceeds this
+                many pixels. 0 keeps the view's full resolution.
+            image_format: "png" or "jpeg"
+
+        Returns the image bytes (sent as an XML-RPC base64 value) or None if a screenshot
         cannot be captured (e.g., when in TechDraw or Spreadsheet view).
         """
-        # First check if the active view supports screenshots
-        def check_view_supports_screenshots():
-            try:
-                active_view = FreeCADGui.ActiveDocument.ActiveView
-                if active_view is None:
-                    FreeCAD.Console.PrintWarning("No active view available\n")
-                    return False
-                
-                view_type = type(active_view).__name__
-                has_save_image = hasattr(active_view, 'saveImage')
-                FreeCAD.Console.PrintMessage(f"View type: {view_type}, Has saveImage: {has_save_image}\n")
-                return has_save_image
-            except Exception as e:
-                FreeCAD.Console.PrintError(f"Error checking view capabilities: {e}\n")
-                return False
-                
-        rpc_request_queue.put(check_view_supports_screenshots)
-        supports_screenshots = rpc_response_queue.get()
-        
-        if not supports_screenshots:
-            FreeCAD.Console.PrintWarning("Current view does not support screenshots\n")
+        if image_format not in _IMAGE_FORMATS:
+            FreeCAD.Console.PrintWarning(f"Unsupported screenshot format: {image_format}\n")
             return None
-            
-        # If view supports screenshots, proceed with capture
-        fd, tmp_path = tempfile.mkstemp(suffix=".png")
-        os.close(fd)
-        rpc_request_queue.put(
-            lambda: self._save_active_screenshot(tmp_path, view_name)
+        # Capability check and capture run as one GUI task; PNG encoding
+        # happens back on the RPC thread so the GUI isn't held up by it.
+        res = dispatch_gui(
+            lambda: self._capture_active_screenshot(view_name), timeout=GUI_TASK_TIMEOUT
         )
-        res = rpc_response_queue.get()
-        if res is True:
-            try:
-                with open(tmp_path, "rb") as image_file:
-                    image_bytes = image_file.read()
-                    encoded = base64.b64encode(image_bytes).decode("utf-8")
-            finally:
-                if os.path.exists(tmp_path):
-                    os.remove(tmp_path)
-            return encoded
-        else:
-            if os.path.exists(tmp_path):
-                os.remove(tmp_path)
+        if isinstance(res, str):
             FreeCAD.Console.PrintWarning(f"Failed to capture screenshot: {res}\n")
             return None
+        if max_dim or image_format != "png":
+            if isinstance(res, bytes):
+                res = QtGui.QImage.fromData(res)
+            if max_dim:
+                res = scale_to_fit(res, max_dim)
+        return res if isinstance(res, bytes) else encode_image(res, image_format)
+
+    def _get_objects_gui(self, doc_name, offset=0, limit=None):
+        try:
+            doc = FreeCAD.getDocument(doc_name)
+        except NameError:
+            return []
+        objs = doc.Objects if limit is None else doc.Objects[offset:offset + limit]
+        return [serialize_object(obj) for obj in objs]
+
+    def _get_objects_names_gui(self, doc_name):
+        try:
+            doc = FreeCAD.getDocument(doc_name)
+        except NameError:
+            return []
+        return [obj.Name for obj in doc.Objects]
+
+    def _get_object_gui(self, doc_name, obj_name):
+        try:
+            obj = FreeCAD.getDocument(doc_name).getObject(obj_name)
+        except NameError:
+            return None
+        return serialize_object(obj) if obj else None
 
     def _create_document_gui(self, name):
         doc = FreeCAD.newDocument(name)
@@ -475,7 +1075,19 @@ class FreeCADRPC:
         FreeCAD.Console.PrintMessage(f"Document '{name}' created via RPC.\n")
         return True
 
-    def _create_object_gui(self, doc_name, obj: Object):
+    def _recompute_gui(self, doc_name: str):
+        try:
+            doc = FreeCAD.getDocument(doc_name)
+            if not doc:
+                return f"Document '{doc_name}' not found."
+
+            doc.recompute()
+            FreeCAD.Console.PrintMessage(f"Document '{doc_name}' recomputed via RPC.\n")
+            return True
+        except Exception as e:
+            return str(e)
+
+    def _create_object_gui(self, doc_name, obj: Object, defer_recompute: bool = False):
         doc = FreeCAD.getDocument(doc_name)
         if not doc:
             available_docs = list(FreeCAD.listDocuments().keys())
@@ -493,20 +1105,20 @@ class FreeCADRPC:
             FreeCAD.Console.PrintError(error_msg + "\n")
             return error_msg
 
+        objects = ObjectLookup(doc)
         try:
             if obj.type == "Fem::FemMeshGmsh" and obj.analysis:
-                from femmesh.gmshtools import GmshTools
+                if GmshTools is None:
+                    raise ValueError("Gmsh meshing tools (femmesh.gmshtools) are not available.")
                 res = getattr(doc, obj.analysis).addObject(ObjectsFem.makeMeshGmsh(doc, obj.name))[0]
                 if "Part" in obj.properties:
-                    target_obj = doc.getObject(obj.properties["Part"])
+                    target_obj = objects[obj.properties["Part"]]
                     if target_obj:
                         res.Part = target_obj
                     else:
-                        available_objs = [o.Label for o in doc.Objects]
                         raise ValueError(
                             f"Referenced object '{obj.properties['Part']}' not found. "
-                            f"Available objects: {', '.join(available_objs[:10])}"
-                            + ("..." if len(available_objs) > 10 else "")
+                            f"Available objects: {available_objects_hint(doc)}"
                         )
                     del obj.properties["Part"]
                 else:
@@ -523,17 +1135,17 @@ class FreeCADRPC:
                     f"FEM Mesh '{res.Name}' generated successfully in '{doc_name}'.\n"
                 )
             elif obj.type.startswith("Fem::"):
-                fem_make_methods = {
-                    "MaterialCommon": ObjectsFem.makeMaterialSolid,
-                    "AnalysisPython": ObjectsFem.makeAnalysis,
-                }
                 obj_type_short = obj.type.split("::")[1]
                 method_name = "make" + obj_type_short
-                make_method = fem_make_methods.get(obj_type_short, getattr(ObjectsFem, method_name, None))
+                make_method = _FEM_MAKE_METHODS.get(obj_type_short)
+                if make_method is None:
+                    make_method = getattr(ObjectsFem, method_name, None)
+                    if callable(make_method):
+                        _FEM_MAKE_METHODS[obj_type_short] = make_method
 
                 if callable(make_method):
                     res = make_method(doc, obj.name)
-                    set_object_property(doc, res, obj.properties)
+                    set_object_property(objects, res, obj.properties)
                     FreeCAD.Console.PrintMessage(
                         f"FEM object '{res.Name}' created with '{method_name}'.\n"
                     )
@@ -543,25 +1155,27 @@ class FreeCADRPC:
                     getattr(doc, obj.analysis).addObject(res)
             else:
                 res = doc.addObject(obj.type, obj.name)
-                set_object_property(doc, res, obj.properties)
+                set_object_property(objects, res, obj.properties)
 
                 # Set ViewObject visibility (NEW - addresses invisible objects issue)
-                if hasattr(res, "ViewObject") and res.ViewObject:
-                    res.ViewObject.Visibility = True
+                vo = getattr(res, "ViewObject", None)
+                if vo:
+                    vo.Visibility = True
                     FreeCAD.Console.PrintMessage(f"ViewObject visibility set for '{res.Name}'.\n")
 
                 FreeCAD.Console.PrintMessage(
                     f"{res.TypeId} '{res.Name}' added to '{doc_name}' via RPC.\n"
                 )
 
-            doc.recompute()
+            if not defer_recompute:
+                doc.recompute()
             return True
         except Exception as e:
             error_msg = f"Failed to create object '{obj.name}': {str(e)}"
             FreeCAD.Console.PrintError(error_msg + "\n")
             return error_msg
 
-    def _edit_object_gui(self, doc_name: str, obj: Object):
+    def _edit_object_gui(self, doc_name: str, obj: Object, defer_recompute: bool = False):
         doc = FreeCAD.getDocument(doc_name)
         if not doc:
             FreeCAD.Console.PrintError(f"Document '{doc_name}' not found.\n")
@@ -572,12 +1186,13 @@ class FreeCADRPC:
             FreeCAD.Console.PrintError(f"Object '{obj.name}' not found in document '{doc_name}'.\n")
             return f"Object '{obj.name}' not found in document '{doc_name}'.\n"
 
+        objects = ObjectLookup(doc)
         try:
             # For Fem::ConstraintFixed
             if hasattr(obj_ins, "References") and "References" in obj.properties:
                 refs = []
                 for ref_name, face in obj.properties["References"]:
-                    ref_obj = doc.getObject(ref_name)
+                    ref_obj = objects[ref_name]
                     if ref_obj:
                         refs.append((ref_obj, face))
                     else:
@@ -588,14 +1203,15 @@ class FreeCADRPC:
                 )
                 # delete References from properties
                 del obj.properties["References"]
-            set_object_property(doc, obj_ins, obj.properties)
-            doc.recompute()
+            set_object_property(objects, obj_ins, obj.properties)
+            if not defer_recompute:
+                doc.recompute()
             FreeCAD.Console.PrintMessage(f"Object '{obj.name}' updated via RPC.\n")
             return True
         except Exception as e:
             return str(e)
 
-    def _delete_object_gui(self, doc_name: str, obj_name: str):
+    def _delete_object_gui(self, doc_name: str, obj_name: str, defer_recompute: bool = False):
         doc = FreeCAD.getDocument(doc_name)
         if not doc:
             FreeCAD.Console.PrintError(f"Document '{doc_name}' not found.\n")
@@ -603,7 +1219,8 @@ class FreeCADRPC:
 
         try:
             doc.removeObject(obj_name)
-            doc.recompute()
+            if not defer_recompute:
+                doc.recompute()
             FreeCAD.Console.PrintMessage(f"Object '{obj_name}' deleted via RPC.\n")
             return True
         except Exception as e:
@@ -616,23 +1233,24 @@ class FreeCADRPC:
         except Exception as e:
             return str(e)
 
+    def _has_workbench(self, workbench_name: str) -> bool:
+        """Check a workbench is installed.
+
+        The list is read once: workbenches are registered at FreeCAD startup,
+        and one installed later only loads after a restart. Misses are
+        therefore answered from the cache too.
+        """
+        if self._wb_cache is None:
+            self._wb_cache = frozenset(FreeCADGui.listWorkbenches())
+        return workbench_name in self._wb_cache
+
     def _activate_workbench_gui(self, workbench_name: str):
         """Activate workbench in GUI thread"""
         try:
-            # List of common workbenches for validation
-            common_workbenches = [
-                "FastenersWorkbench", "PartDesign", "Draft", "Sketcher",
-                "Arch", "Path", "Part", "Fem", "Drawing", "Mesh", "Points",
-                "Raytracing", "Spreadsheet", "Surface", "TechDraw", "Web"
-            ]
-
-            # Get list of available workbenches
-            available_workbenches = FreeCADGui.listWorkbenches()
-
-            if workbench_name not in available_workbenches:
+            if not self._has_workbench(workbench_name):
                 return (
                     f"Workbench '{workbench_name}' not found. "
-                    f"Available workbenches: {', '.join(sorted(available_workbenches.keys()))}"
+                    f"Available workbenches: {', '.join(sorted(self._wb_cache))}"
                 )
 
             # Activate the workbench
@@ -651,7 +1269,8 @@ class FreeCADRPC:
         base_obj_name: str,
         tool_obj_name: str,
         result_name: str = None,
-        keep_originals: bool = False
+        keep_originals: bool = False,
+        defer_recompute: bool = False
     ):
         """Perform boolean operation in GUI thread"""
         try:
@@ -664,29 +1283,29 @@ class FreeCADRPC:
                 return error_msg
 
             # Get objects
-            base_obj = doc.getObject(base_obj_name)
-            tool_obj = doc.getObject(tool_obj_name)
+            objects = ObjectLookup(doc)
+            base_obj = objects[base_obj_name]
+            tool_obj = objects[tool_obj_name]
 
             if not base_obj:
-                available_objs = [o.Label for o in doc.Objects]
                 return (
                     f"Base object '{base_obj_name}' not found in document '{doc_name}'. "
-                    f"Available objects: {', '.join(available_objs[:10])}"
-                    + ("..." if len(available_objs) > 10 else "")
+                    f"Available objects: {available_objects_hint(doc)}"
                 )
 
             if not tool_obj:
-                available_objs = [o.Label for o in doc.Objects]
                 return (
                     f"Tool object '{tool_obj_name}' not found in document '{doc_name}'. "
-                    f"Available objects: {', '.join(available_objs[:10])}"
-                    + ("..." if len(available_objs) > 10 else "")
+                    f"Available objects: {available_objects_hint(doc)}"
                 )
 
             # Validate operation
             if operation not in ["cut", "fuse", "common"]:
                 return f"Invalid operation '{operation}'. Must be 'cut', 'fuse', or 'common'."
 
+            # Operands created earlier in a batch may not have a shape yet
+            ensure_recomputed(base_obj, tool_obj)
+
             # Perform boolean operation
             if operation == "cut":
                 result_shape = base_obj.Shape.cut(tool_obj.Shape)
@@ -706,17 +1325,19 @@ class FreeCADRPC:
             result_obj.Shape = result_shape
 
             # Set ViewObject properties
-            if hasattr(result_obj, "ViewObject") and result_obj.ViewObject:
-                result_obj.ViewObject.Visibility = True
+            vo = getattr(result_obj, "ViewObject", None)
+            if vo:
+                vo.Visibility = True
 
             # Hide or delete originals
             if not keep_originals:
-                if hasattr(base_obj, "ViewObject") and base_obj.ViewObject:
-                    base_obj.ViewObject.Visibility = False
-                if hasattr(tool_obj, "ViewObject") and tool_obj.ViewObject:
-                    tool_obj.ViewObject.Visibility = False
+                for original in (base_obj, tool_obj):
+                    vo = getattr(original, "ViewObject", None)
+                    if vo:
+                        vo.Visibility = False
 
-            doc.recompute()
+            if not defer_recompute:
+                doc.recompute()
 
             FreeCAD.Console.PrintMessage(
                 f"Boolean operation '{operation}' completed: '{result_obj.Name}' created.\n"
@@ -736,10 +1357,11 @@ class FreeCADRPC:
         doc_name: str,
         name: str,
         fastener_type: str,
-        position: dict[str, float] = None,
+        position: dict[str, float] | list[float] = None,
         attach_to: str = None,
         diameter: str = "M4",
-        length: str = "10"
+        length: str = "10",
+        defer_recompute: bool = False
     ):
         """Create fastener in GUI thread"""
         try:
@@ -752,17 +1374,17 @@ class FreeCADRPC:
                 return error_msg
 
             # Ensure FastenersWorkbench is activated
-            available_workbenches = FreeCADGui.listWorkbenches()
-            if "FastenersWorkbench" not in available_workbenches:
+            if not self._has_workbench("FastenersWorkbench"):
                 return (
                     "FastenersWorkbench not found. "
                     "Please install the Fasteners Workbench add-on from FreeCAD."
                 )
 
-            # Activate FastenersWorkbench
-            FreeCADGui.activateWorkbench("FastenersWorkbench")
-
-            # Import FastenersCmd
+            # FastenersCmd is importable only once the workbench has loaded.
+            # Activate it the first time only; switching workbenches on every
+            # call rebuilds the toolbars and yanks the user's GUI around.
+            if "FastenersCmd" not in sys.modules:
+                FreeCADGui.activateWorkbench("FastenersWorkbench")
             import FastenersCmd
 
             # Get attach_to object if specified
@@ -770,11 +1392,9 @@ class FreeCADRPC:
             if attach_to:
                 attach_obj = doc.getObject(attach_to)
                 if not attach_obj:
-                    available_objs = [o.Label for o in doc.Objects]
                     return (
                         f"Attach object '{attach_to}' not found in document '{doc_name}'. "
-                        f"Available objects: {', '.join(available_objs[:10])}"
-                        + ("..." if len(available_objs) > 10 else "")
+                        f"Available objects: {available_objects_hint(doc)}"
                     )
 
             # Create fastener object
@@ -786,17 +1406,14 @@ class FreeCADRPC:
 
             # Set position if provided
             if position:
-                screw_obj.Placement.Base = FreeCAD.Vector(
-                    position.get("x", 0),
-                    position.get("y", 0),
-                    position.get("z", 0)
-                )
+                screw_obj.Placement.Base = _vec(position)
 
             # Set ViewObject properties for visibility
-            if hasattr(screw_obj, "ViewObject") and screw_obj.ViewObject:
+            if _HAS_GUI:
                 screw_obj.ViewObject.Visibility = True
 
-            doc.recompute()
+            if not defer_recompute:
+                doc.recompute()
 
             FreeCAD.Console.PrintMessage(
                 f"Fastener '{screw_obj.Name}' ({fastener_type}) created successfully.\n"
@@ -811,6 +1428,53 @@ class FreeCADRPC:
             FreeCAD.Console.PrintError(error_msg + "\n")
             return error_msg
 
+    def _batch_create_object(self, doc_name: str, obj_data: dict[str, Any]):
+        """Create an object inside a batch, reporting its name on success"""
+        obj = object_from_data(obj_data)
+        res = self._create_object_gui(doc_name, obj, defer_recompute=True)
+        return {"object_name": obj.name} if res is True else res
+
+    def _execute_batch_gui(self, doc_name: str, calls: list[dict[str, Any]]):
+        """Run batched calls in GUI thread with a single trailing recompute"""
+        try:
+            doc = FreeCAD.getDocument(doc_name)
+            if not doc:
+                return f"Document '{doc_name}' not found."
+
+            results = []
+            doc.openTransaction("MCP batch")
+            try:
+                for call in calls:
+                    method = call.get("method")
+                    handler = self._method_map.get(method)
+                    if handler is None:
+                        res = f"Unsupported batch method '{method}'"
+                    else:
+                        try:
+                            res = handler(doc_name, **call.get("args", {}))
+                        except Exception as e:
+                            res = f"{method} failed: {str(e)}"
+
+                    if isinstance(res, str):
+                        results.append({"success": False, "error": res})
+                    elif isinstance(res, dict):
+                        results.append({"success": True, **res})
+                    else:
+                        results.append({"success": True})
+            finally:
+                doc.commitTransaction()
+
+            doc.recompute()
+            FreeCAD.Console.PrintMessage(
+                f"Batch of {len(calls)} calls executed on '{doc_name}' via RPC.\n"
+            )
+            return {"results": results}
+
+        except Exception as e:
+            error_msg = f"Failed to execute batch: {str(e)}"
+            FreeCAD.Console.PrintError(error_msg + "\n")
+            return error_msg
+
     # ============================================================
     # NEW SKETCH AND EXTRUSION METHODS
     # ============================================================
@@ -820,8 +1484,9 @@ class FreeCADRPC:
         doc_name: str,
         name: str,
         plane: str = "XY",
-        origin: dict[str, float] = None,
-        body_name: str = None
+        origin: dict[str, float] | list[float] = None,
+        body_name: str = None,
+        defer_recompute: bool = False
     ) -> dict[str, Any]:
         """Create a new sketch on a specified plane.
         
@@ -829,16 +1494,21 @@ class FreeCADRPC:
             doc_name: Document name
             name: Sketch name
             plane: Plane to create sketch on - "XY", "XZ", or "YZ"
-            origin: Optional origin offset {x, y, z}
+            origin: Optional origin offset, {x, y, z} or [x, y, z]
             body_name: Optional PartDesign Body to add sketch to
+            defer_recompute: If True, skip the document recompute (call recompute() later)
         
         Returns:
             Success status and sketch name
         """
-        rpc_request_queue.put(
-            lambda: self._create_sketch_gui(doc_name, name, plane, origin, body_name)
+        plane = plane.upper()
+        if plane not in _PLANE_ROTATIONS:
+            return {"success": False, "error": f"Invalid plane '{plane}'. Use 'XY', 'XZ', or 'YZ'."}
+        res = dispatch_gui(
+            lambda: self._create_sketch_gui(
+                doc_name, name, plane, origin, body_name, defer_recompute
+            )
         )
-        res = rpc_response_queue.get()
         if isinstance(res, str):
             return {"success": False, "error": res}
         return {"success": True, "sketch_name": res["sketch_name"], "message": res["message"]}
@@ -848,14 +1518,12 @@ class FreeCADRPC:
         doc_name: str,
         name: str,
         plane: str,
-        origin: dict[str, float],
-        body_name: str
+        origin: dict[str, float] | list[float],
+        body_name: str,
+        defer_recompute: bool = False
     ):
-        """Create sketch in GUI thread"""
+        """Create sketch in GUI thread. ``plane`` must already be validated."""
         try:
-            import Part
-            import Sketcher
-            
             doc = FreeCAD.getDocument(doc_name)
             if not doc:
                 return f"Document '{doc_name}' not found."
@@ -876,32 +1544,12 @@ class FreeCADRPC:
                 sketch = doc.addObject('Sketcher::SketchObject', name)
             
             # Set placement based on plane
-            origin_x = origin.get("x", 0) if origin else 0
-            origin_y = origin.get("y", 0) if origin else 0
-            origin_z = origin.get("z", 0) if origin else 0
-            
-            if plane.upper() == "XY":
-                # Default - no rotation needed
-                sketch.Placement = FreeCAD.Placement(
-                    FreeCAD.Vector(origin_x, origin_y, origin_z),
-                    FreeCAD.Rotation(FreeCAD.Vector(0, 0, 1), 0)
-                )
-            elif plane.upper() == "XZ":
-                # Rotate 90° around X axis
-                sketch.Placement = FreeCAD.Placement(
-                    FreeCAD.Vector(origin_x, origin_y, origin_z),
-                    FreeCAD.Rotation(FreeCAD.Vector(1, 0, 0), 90)
-                )
-            elif plane.upper() == "YZ":
-                # Rotate 90° around Y axis
-                sketch.Placement = FreeCAD.Placement(
-                    FreeCAD.Vector(origin_x, origin_y, origin_z),
-                    FreeCAD.Rotation(FreeCAD.Vector(0, 1, 0), -90)
-                )
-            else:
-                return f"Invalid plane '{plane}'. Use 'XY', 'XZ', or 'YZ'."
+            sketch.Placement = FreeCAD.Placement(
+                _vec(origin) if origin else _Vector(), _PLANE_ROTATIONS[plane]
+            )
             
-            doc.recompute()
+            if not defer_recompute:
+                doc.recompute()
             FreeCAD.Console.PrintMessage(f"Sketch '{name}' created on {plane} plane.\n")
             return {"sketch_name": name, "message": f"Sketch created on {plane} plane"}
             
@@ -915,7 +1563,8 @@ class FreeCADRPC:
         doc_name: str,
         sketch_name: str,
         geometry: list[dict[str, Any]],
-        construction: bool = False
+        construction: bool = False,
+        defer_recompute: bool = False
     ) -> dict[str, Any]:
         """Add geometry to a sketch.
         
@@ -928,14 +1577,16 @@ class FreeCADRPC:
                 - {"type": "circle", "cx": 0, "cy": 0, "radius": 5}
                 - {"type": "arc", "cx": 0, "cy": 0, "radius": 5, "start_angle": 0, "end_angle": 90}
             construction: Whether geometry is construction geometry
+            defer_recompute: If True, skip the document recompute (call recompute() later)
         
         Returns:
             Success status and geometry IDs
         """
-        rpc_request_queue.put(
-            lambda: self._add_sketch_geometry_gui(doc_name, sketch_name, geometry, construction)
+        res = dispatch_gui(
+            lambda: self._add_sketch_geometry_gui(
+                doc_name, sketch_name, geometry, construction, defer_recompute
+            )
         )
-        res = rpc_response_queue.get()
         if isinstance(res, str):
             return {"success": False, "error": res}
         return {"success": True, "geometry_ids": res["geometry_ids"], "message": res["message"]}
@@ -945,14 +1596,11 @@ class FreeCADRPC:
         doc_name: str,
         sketch_name: str,
         geometry: list[dict[str, Any]],
-        construction: bool
+        construction: bool,
+        defer_recompute: bool = False
     ):
         """Add geometry to sketch in GUI thread"""
         try:
-            import Part
-            import Sketcher
-            import math
-            
             doc = FreeCAD.getDocument(doc_name)
             if not doc:
                 return f"Document '{doc_name}' not found."
@@ -964,82 +1612,45 @@ class FreeCADRPC:
             if not hasattr(sketch, 'addGeometry'):
                 return f"Object '{sketch_name}' is not a valid sketch."
             
-            geometry_ids = []
+            # Collect everything first and hand it to the sketch in one
+            # addGeometry / addConstraint call each.
+            geoms = []
+            coincident = []
             
             for geom in geometry:
                 geom_type = geom.get("type", "").lower()
-                
-                if geom_type == "line":
-                    x1 = geom.get("x1", 0)
-                    y1 = geom.get("y1", 0)
-                    x2 = geom.get("x2", 0)
-                    y2 = geom.get("y2", 0)
-                    line = Part.LineSegment(
-                        FreeCAD.Vector(x1, y1, 0),
-                        FreeCAD.Vector(x2, y2, 0)
-                    )
-                    gid = sketch.addGeometry(line, construction)
-                    geometry_ids.append(gid)
-                    
-                elif geom_type == "rectangle":
-                    x = geom.get("x", 0)
-                    y = geom.get("y", 0)
-                    w = geom.get("width", 10)
-                    h = geom.get("height", 10)
-                    # Create 4 lines for rectangle
-                    l1 = Part.LineSegment(FreeCAD.Vector(x, y, 0), FreeCAD.Vector(x + w, y, 0))
-                    l2 = Part.LineSegment(FreeCAD.Vector(x + w, y, 0), FreeCAD.Vector(x + w, y + h, 0))
-                    l3 = Part.LineSegment(FreeCAD.Vector(x + w, y + h, 0), FreeCAD.Vector(x, y + h, 0))
-                    l4 = Part.LineSegment(FreeCAD.Vector(x, y + h, 0), FreeCAD.Vector(x, y, 0))
-                    
-                    id1 = sketch.addGeometry(l1, construction)
-                    id2 = sketch.addGeometry(l2, construction)
-                    id3 = sketch.addGeometry(l3, construction)
-                    id4 = sketch.addGeometry(l4, construction)
-                    
-                    # Add coincident constraints to close rectangle
-                    sketch.addConstraint(Sketcher.Constraint('Coincident', id1, 2, id2, 1))
-                    sketch.addConstraint(Sketcher.Constraint('Coincident', id2, 2, id3, 1))
-                    sketch.addConstraint(Sketcher.Constraint('Coincident', id3, 2, id4, 1))
-                    sketch.addConstraint(Sketcher.Constraint('Coincident', id4, 2, id1, 1))
-                    
-                    geometry_ids.extend([id1, id2, id3, id4])
-                    
-                elif geom_type == "circle":
-                    cx = geom.get("cx", 0)
-                    cy = geom.get("cy", 0)
-                    r = geom.get("radius", 5)
-                    circle = Part.Circle(
-                        FreeCAD.Vector(cx, cy, 0),
-                        FreeCAD.Vector(0, 0, 1),
-                        r
-                    )
-                    gid = sketch.addGeometry(circle, construction)
-                    geometry_ids.append(gid)
-                    
-                elif geom_type == "arc":
-                    cx = geom.get("cx", 0)
-                    cy = geom.get("cy", 0)
-                    r = geom.get("radius", 5)
-                    start_angle = math.radians(geom.get("start_angle", 0))
-                    end_angle = math.radians(geom.get("end_angle", 90))
-                    
-                    arc = Part.ArcOfCircle(
-                        Part.Circle(
-                            FreeCAD.Vector(cx, cy, 0),
-                            FreeCAD.Vector(0, 0, 1),
-                            r
-                        ),
-                        start_angle,
-                        end_angle
-                    )
-                    gid = sketch.addGeometry(arc, construction)
-                    geometry_ids.append(gid)
-                    
-                else:
+                builder = _GEOM_BUILDERS.get(geom_type)
+                if builder is None:
                     return f"Unknown geometry type: '{geom_type}'"
+                built, joins = builder(geom)
+                offset = len(geoms)
+                geoms += built
+                coincident += [(offset + a, pa, offset + b, pb) for a, pa, b, pb in joins]
             
-            doc.recompute()
+            geometry_ids = []
+            if geoms:
+                # GeometryCount avoids copying the whole Geometry list
+                first_id = sketch.GeometryCount
+                added = sketch.addGeometry(geoms, construction)
+                if isinstance(added, (list, tuple)):
+                    geometry_ids = list(added)
+                else:
+                    geometry_ids = list(range(first_id, first_id + len(geoms)))
+            
+            # Coincident constraints joining multi-edge shapes (rectangles)
+            if coincident:
+                sketch.addConstraint([
+                    Sketcher.Constraint(
+                        'Coincident', geometry_ids[a], pa, geometry_ids[b], pb
+                    )
+                    for a, pa, b, pb in coincident
+                ])
+            
+            if not defer_recompute:
+                # Only this sketch changed: recompute just it so its Shape
+                # (and the screenshot) is current; dependents are rebuilt by
+                # the next document recompute
+                sketch.recompute()
             FreeCAD.Console.PrintMessage(
                 f"Added {len(geometry_ids)} geometry elements to sketch '{sketch_name}'.\n"
             )
@@ -1054,7 +1665,8 @@ class FreeCADRPC:
         self,
         doc_name: str,
         sketch_name: str,
-        constraints: list[dict[str, Any]]
+        constraints: list[dict[str, Any]],
+        defer_recompute: bool = False
     ) -> dict[str, Any]:
         """Add constraints to a sketch.
         
@@ -1070,14 +1682,16 @@ class FreeCADRPC:
                 - {"type": "equal", "id1": 0, "id2": 1}
                 - {"type": "perpendicular", "id1": 0, "id2": 1}
                 - {"type": "fix", "geometry_id": 0, "point": 1}  (point 1=start, 2=end, 3=center)
+            defer_recompute: If True, skip the document recompute (call recompute() later)
         
         Returns:
             Success status and constraint count
         """
-        rpc_request_queue.put(
-            lambda: self._add_sketch_constraints_gui(doc_name, sketch_name, constraints)
+        res = dispatch_gui(
+            lambda: self._add_sketch_constraints_gui(
+                doc_name, sketch_name, constraints, defer_recompute
+            )
         )
-        res = rpc_response_queue.get()
         if isinstance(res, str):
             return {"success": False, "error": res}
         return {"success": True, "constraint_count": res["constraint_count"], "message": res["message"]}
@@ -1086,12 +1700,11 @@ class FreeCADRPC:
         self,
         doc_name: str,
         sketch_name: str,
-        constraints: list[dict[str, Any]]
+        constraints: list[dict[str, Any]],
+        defer_recompute: bool = False
     ):
         """Add constraints to sketch in GUI thread"""
         try:
-            import Sketcher
-            
             doc = FreeCAD.getDocument(doc_name)
             if not doc:
                 return f"Document '{doc_name}' not found."
@@ -1100,80 +1713,30 @@ class FreeCADRPC:
             if not sketch:
                 return f"Sketch '{sketch_name}' not found."
             
-            constraint_count = 0
+            sk_constraints = []
             
             for c in constraints:
                 c_type = c.get("type", "").lower()
-                
-                if c_type == "horizontal":
-                    gid = c.get("geometry_id", 0)
-                    sketch.addConstraint(Sketcher.Constraint('Horizontal', gid))
-                    constraint_count += 1
-                    
-                elif c_type == "vertical":
-                    gid = c.get("geometry_id", 0)
-                    sketch.addConstraint(Sketcher.Constraint('Vertical', gid))
-                    constraint_count += 1
-                    
-                elif c_type == "coincident":
-                    id1 = c.get("id1", 0)
-                    pt1 = c.get("point1", 2)  # default: end point
-                    id2 = c.get("id2", 1)
-                    pt2 = c.get("point2", 1)  # default: start point
-                    sketch.addConstraint(Sketcher.Constraint('Coincident', id1, pt1, id2, pt2))
-                    constraint_count += 1
-                    
-                elif c_type == "distance":
-                    gid = c.get("geometry_id", 0)
-                    value = c.get("value", 10.0)
-                    sketch.addConstraint(Sketcher.Constraint('Distance', gid, value))
-                    constraint_count += 1
-                    
-                elif c_type == "radius":
-                    gid = c.get("geometry_id", 0)
-                    value = c.get("value", 5.0)
-                    sketch.addConstraint(Sketcher.Constraint('Radius', gid, value))
-                    constraint_count += 1
-                    
-                elif c_type == "equal":
-                    id1 = c.get("id1", 0)
-                    id2 = c.get("id2", 1)
-                    sketch.addConstraint(Sketcher.Constraint('Equal', id1, id2))
-                    constraint_count += 1
-                    
-                elif c_type == "perpendicular":
-                    id1 = c.get("id1", 0)
-                    id2 = c.get("id2", 1)
-                    sketch.addConstraint(Sketcher.Constraint('Perpendicular', id1, id2))
-                    constraint_count += 1
-                    
-                elif c_type == "parallel":
-                    id1 = c.get("id1", 0)
-                    id2 = c.get("id2", 1)
-                    sketch.addConstraint(Sketcher.Constraint('Parallel', id1, id2))
-                    constraint_count += 1
-                    
-                elif c_type == "fix":
-                    gid = c.get("geometry_id", 0)
-                    pt = c.get("point", 1)
-                    sketch.addConstraint(Sketcher.Constraint('Fixed', gid, pt))
-                    constraint_count += 1
-                    
-                elif c_type == "symmetric":
-                    id1 = c.get("id1", 0)
-                    pt1 = c.get("point1", 1)
-                    id2 = c.get("id2", 0)
-                    pt2 = c.get("point2", 2)
-                    axis = c.get("axis", "Y")
-                    # -1 = X-axis, -2 = Y-axis
-                    axis_id = -2 if axis.upper() == "Y" else -1
-                    sketch.addConstraint(Sketcher.Constraint('Symmetric', id1, pt1, id2, pt2, axis_id))
-                    constraint_count += 1
-                    
-                else:
+                spec = _CONSTRAINT_ARGS.get(c_type)
+                if spec is None:
                     FreeCAD.Console.PrintWarning(f"Unknown constraint type: '{c_type}'\n")
+                    continue
+                sk_name, fields = spec
+                args = [c.get(key, default) for key, default in fields]
+                if c_type == "symmetric":
+                    # -1 = X-axis, -2 = Y-axis
+                    args.append(-2 if c.get("axis", "Y").upper() == "Y" else -1)
+                sk_constraints.append(Sketcher.Constraint(sk_name, *args))
             
-            doc.recompute()
+            if sk_constraints:
+                sketch.addConstraint(sk_constraints)
+            constraint_count = len(sk_constraints)
+            
+            if not defer_recompute:
+                # Only this sketch changed: recompute just it so its Shape
+                # (and the screenshot) is current; dependents are rebuilt by
+                # the next document recompute
+                sketch.recompute()
             FreeCAD.Console.PrintMessage(
                 f"Added {constraint_count} constraints to sketch '{sketch_name}'.\n"
             )
@@ -1192,7 +1755,8 @@ class FreeCADRPC:
         length: float,
         symmetric: bool = False,
         reversed: bool = False,
-        body_name: str = None
+        body_name: str = None,
+        defer_recompute: bool = False
     ) -> dict[str, Any]:
         """Create an extrusion (Pad) from a sketch.
         
@@ -1204,16 +1768,17 @@ class FreeCADRPC:
             symmetric: If True, extrude half in each direction
             reversed: If True, reverse extrusion direction
             body_name: Optional PartDesign Body name
+            defer_recompute: If True, skip the document recompute (call recompute() later)
         
         Returns:
             Success status and extrusion object name
         """
-        rpc_request_queue.put(
+        res = dispatch_gui(
             lambda: self._create_extrusion_gui(
-                doc_name, name, sketch_name, length, symmetric, reversed, body_name
+                doc_name, name, sketch_name, length, symmetric, reversed, body_name,
+                defer_recompute
             )
         )
-        res = rpc_response_queue.get()
         if isinstance(res, str):
             return {"success": False, "error": res}
         return {"success": True, "object_name": res["object_name"], "message": res["message"]}
@@ -1226,7 +1791,8 @@ class FreeCADRPC:
         length: float,
         symmetric: bool,
         reversed: bool,
-        body_name: str
+        body_name: str,
+        defer_recompute: bool = False
     ):
         """Create extrusion in GUI thread"""
         try:
@@ -1243,12 +1809,19 @@ class FreeCADRPC:
             if body_name:
                 body = doc.getObject(body_name)
             else:
-                # Try to find the body that contains the sketch
-                for obj in doc.Objects:
-                    if obj.TypeId == 'PartDesign::Body':
-                        if hasattr(obj, 'Group') and sketch in obj.Group:
-                            body = obj
-                            break
+                # Find the body that contains the sketch
+                if hasattr(sketch, 'getParentGeoFeatureGroup'):
+                    parent = sketch.getParentGeoFeatureGroup()
+                    if parent is not None and parent.TypeId == 'PartDesign::Body':
+                        body = parent
+                if body is None:
+                    # Older FreeCAD: a Body links to its members, so only
+                    # objects linking to the sketch qualify.
+                    for obj in sketch.InList:
+                        if obj.TypeId == 'PartDesign::Body':
+                            if hasattr(obj, 'Group') and sketch in obj.Group:
+                                body = obj
+                                break
             
             # Create Pad
             if body:
@@ -1263,10 +1836,11 @@ class FreeCADRPC:
             pad.Midplane = symmetric
             
             # Hide sketch after extrusion
-            if hasattr(sketch, 'ViewObject') and sketch.ViewObject:
+            if _HAS_GUI:
                 sketch.ViewObject.Visibility = False
             
-            doc.recompute()
+            if not defer_recompute:
+                doc.recompute()
             
             FreeCAD.Console.PrintMessage(
                 f"Extrusion '{name}' created from sketch '{sketch_name}' (length={length}mm).\n"
@@ -1281,17 +1855,107 @@ class FreeCADRPC:
             FreeCAD.Console.PrintError(error_msg + "\n")
             return error_msg
     
+    def build_feature(
+        self,
+        doc_name: str,
+        sketch: dict[str, Any],
+        geometry: list[dict[str, Any]] = None,
+        constraints: list[dict[str, Any]] = None,
+        extrusion: dict[str, Any] = None
+    ) -> dict[str, Any]:
+        """Create a sketch, fill it and pad it with a single recompute.
+        
+        Args:
+            doc_name: Document name
+            sketch: create_sketch arguments {name, plane, origin, body_name}
+            geometry: Optional geometry list, as for add_sketch_geometry
+            constraints: Optional constraint list, as for add_sketch_constraints
+            extrusion: Optional create_extrusion arguments {name, length, symmetric, reversed}.
+                The sketch and body come from the sketch spec.
+        
+        Returns:
+            Success status, sketch name, geometry IDs, constraint count and pad name
+        """
+        plane = sketch.get("plane", "XY").upper()
+        if plane not in _PLANE_ROTATIONS:
+            return {"success": False, "error": f"Invalid plane '{plane}'. Use 'XY', 'XZ', or 'YZ'."}
+        sketch = {**sketch, "plane": plane}
+        res = dispatch_gui(
+            lambda: self._build_feature_gui(doc_name, sketch, geometry, constraints, extrusion)
+        )
+        if isinstance(res, str):
+            return {"success": False, "error": res}
+        return {"success": True, **res}
+    
+    def _build_feature_gui(
+        self,
+        doc_name: str,
+        sketch: dict[str, Any],
+        geometry: list[dict[str, Any]],
+        constraints: list[dict[str, Any]],
+        extrusion: dict[str, Any]
+    ):
+        """Build sketch, geometry, constraints and pad in GUI thread"""
+        try:
+            doc = FreeCAD.getDocument(doc_name)
+            sketch_name = sketch["name"]
+            body_name = sketch.get("body_name")
+            
+            res = self._create_sketch_gui(
+                doc_name, sketch_name, sketch["plane"], sketch.get("origin"),
+                body_name, defer_recompute=True
+            )
+            if isinstance(res, str):
+                return res
+            result = {"sketch_name": sketch_name}
+            
+            if geometry:
+                res = self._add_sketch_geometry_gui(
+                    doc_name, sketch_name, geometry, False, defer_recompute=True
+                )
+                if isinstance(res, str):
+                    return res
+                result["geometry_ids"] = res["geometry_ids"]
+            
+            if constraints:
+                res = self._add_sketch_constraints_gui(
+                    doc_name, sketch_name, constraints, defer_recompute=True
+                )
+                if isinstance(res, str):
+                    return res
+                result["constraint_count"] = res["constraint_count"]
+            
+            if extrusion:
+                res = self._create_extrusion_gui(
+                    doc_name, extrusion["name"], sketch_name, extrusion["length"],
+                    extrusion.get("symmetric", False), extrusion.get("reversed", False),
+                    body_name, defer_recompute=True
+                )
+                if isinstance(res, str):
+                    return res
+                result["object_name"] = res["object_name"]
+            
+            doc.recompute()
+            FreeCAD.Console.PrintMessage(f"Feature from sketch '{sketch_name}' built via RPC.\n")
+            return result
+            
+        except Exception as e:
+            error_msg = f"Failed to build feature: {str(e)}"
+            FreeCAD.Console.PrintError(error_msg + "\n")
+            return error_msg
+    
     def create_2020_extrusion(
         self,
         doc_name: str,
         name: str,
         length: float,
-        position: dict[str, float] = None,
+        position: dict[str, float] | list[float] = None,
         direction: str = "Z",
         color: list[float] = None,
         simplified: bool = True,
         profile_variant: str = "2020",
-        sealed_rotation: int = 0
+        sealed_rotation: int = 0,
+        defer_recompute: bool = False
     ) -> dict[str, Any]:
         """Create a 2020 aluminum extrusion profile.
         
@@ -1299,7 +1963,7 @@ class FreeCADRPC:
             doc_name: Document name
             name: Object name
             length: Extrusion length in mm
-            position: Optional position {x, y, z}
+            position: Optional position, {x, y, z} or [x, y, z]
             direction: Extrusion axis - "X", "Y", or "Z"
             color: Optional RGBA color [R, G, B, A]
             simplified: If True, use simple 20x20 box (fast). If False, create T-slot profile.
@@ -1309,21 +1973,100 @@ class FreeCADRPC:
                             For 2020N1: which face is sealed
                             For 2020N2: which corner has the 2 sealed faces
                             For 2020N3: which face has the slot
+            defer_recompute: If True, skip the document recompute (call recompute() later)
         
         Returns:
             Success status and object name
         """
-        rpc_request_queue.put(
+        try:
+            direction, profile_variant = _normalize_2020_args(direction, profile_variant)
+        except ValueError as e:
+            return {"success": False, "error": str(e)}
+        res = dispatch_gui(
             lambda: self._create_2020_extrusion_gui(
                 doc_name, name, length, position, direction, color, simplified,
-                profile_variant, sealed_rotation
+                profile_variant, sealed_rotation, defer_recompute
             )
         )
-        res = rpc_response_queue.get()
         if isinstance(res, str):
             return {"success": False, "error": res}
         return {"success": True, "object_name": res["object_name"], "message": res["message"]}
     
+    def create_2020_extrusions(
+        self,
+        doc_name: str,
+        extrusions: list[dict[str, Any]]
+    ) -> dict[str, Any]:
+        """Create several 2020 extrusion profiles in a single GUI task.
+
+        The new simplified profiles are recomputed together once at the end.
+        
+        Args:
+            doc_name: Document name
+            extrusions: List of dicts with create_2020_extrusion's keyword
+                arguments (name, length, position, direction, color, simplified,
+                profile_variant, sealed_rotation)
+        
+        Returns:
+            Success status and one {"success": ...} result per extrusion, in order
+        """
+        res = dispatch_gui(lambda: self._create_2020_extrusions_gui(doc_name, extrusions))
+        if isinstance(res, str):
+            return {"success": False, "error": res}
+        return {"success": True, "results": res["results"], "message": res["message"]}
+    
+    def _batch_2020_extrusion(
+        self,
+        doc_name: str,
+        name: str,
+        length: float,
+        position: dict[str, float] | list[float] = None,
+        direction: str = "Z",
+        color: list[float] = None,
+        simplified: bool = True,
+        profile_variant: str = "2020",
+        sealed_rotation: int = 0
+    ):
+        """Create one 2020 extrusion of a batch, leaving the recompute to the caller"""
+        direction, profile_variant = _normalize_2020_args(direction, profile_variant)
+        return self._create_2020_extrusion_gui(
+            doc_name, name, length, position, direction, color, simplified,
+            profile_variant, sealed_rotation, defer_recompute=True
+        )
+    
+    def _create_2020_extrusions_gui(self, doc_name: str, extrusions: list[dict[str, Any]]):
+        """Create batched 2020 extrusions in GUI thread"""
+        try:
+            doc = FreeCAD.getDocument(doc_name)
+            if not doc:
+                return f"Document '{doc_name}' not found."
+            
+            results = []
+            created = 0
+            for spec in extrusions:
+                try:
+                    res = self._batch_2020_extrusion(doc_name, **spec)
+                except Exception as e:
+                    res = f"Failed to create 2020 extrusion: {str(e)}"
+                if isinstance(res, str):
+                    results.append({"success": False, "error": res})
+                else:
+                    results.append({"success": True, **res})
+                    created += 1
+            
+            # One pass builds the shapes of all the new simplified boxes
+            if created:
+                doc.recompute()
+            
+            msg = f"Created {created} of {len(extrusions)} 2020 extrusions"
+            FreeCAD.Console.PrintMessage(msg + "\n")
+            return {"results": results, "message": msg}
+            
+        except Exception as e:
+            error_msg = f"Failed to create 2020 extrusions: {str(e)}"
+            FreeCAD.Console.PrintError(error_msg + "\n")
+            return error_msg
+    
     def _create_2020_extrusion_gui(
         self,
         doc_name: str,
@@ -1334,190 +2077,80 @@ class FreeCADRPC:
         color: list[float],
         simplified: bool,
         profile_variant: str = "2020",
-        sealed_rotation: int = 0
+        sealed_rotation: int = 0,
+        defer_recompute: bool = False
     ):
-        """Create 2020 extrusion in GUI thread"""
+        """Create 2020 extrusion in GUI thread.
+
+        ``direction`` and ``profile_variant`` must already be normalized.
+        """
         try:
-            import Part
-            
             doc = FreeCAD.getDocument(doc_name)
             if not doc:
                 return f"Document '{doc_name}' not found."
             
-            pos_x = position.get("x", 0) if position else 0
-            pos_y = position.get("y", 0) if position else 0
-            pos_z = position.get("z", 0) if position else 0
-            
-            # Normalize profile variant
-            variant = profile_variant.upper().replace("-", "")
+            pos_x, pos_y, pos_z = _xyz(position)
             
             if simplified:
                 # Create simple 20x20mm box
-                if direction.upper() == "Z":
+                if direction == "Z":
                     obj = doc.addObject("Part::Box", name)
                     obj.Length = 20
                     obj.Width = 20
                     obj.Height = length
                     # Center the profile
-                    obj.Placement.Base = FreeCAD.Vector(pos_x - 10, pos_y - 10, pos_z)
-                elif direction.upper() == "Y":
+                    obj.Placement = _Placement(
+                        _Vector(pos_x - 10, pos_y - 10, pos_z), _EXTRUSION_ROTATIONS["Z"]
+                    )
+                elif direction == "Y":
                     obj = doc.addObject("Part::Box", name)
                     obj.Length = 20
                     obj.Width = length
                     obj.Height = 20
-                    obj.Placement.Base = FreeCAD.Vector(pos_x - 10, pos_y, pos_z - 10)
-                elif direction.upper() == "X":
+                    obj.Placement = _Placement(
+                        _Vector(pos_x - 10, pos_y, pos_z - 10), _EXTRUSION_ROTATIONS["Z"]
+                    )
+                elif direction == "X":
                     obj = doc.addObject("Part::Box", name)
                     obj.Length = length
                     obj.Width = 20
                     obj.Height = 20
-                    obj.Placement.Base = FreeCAD.Vector(pos_x, pos_y - 10, pos_z - 10)
-                else:
-                    return f"Invalid direction '{direction}'. Use 'X', 'Y', or 'Z'."
+                    obj.Placement = _Placement(
+                        _Vector(pos_x, pos_y - 10, pos_z - 10), _EXTRUSION_ROTATIONS["Z"]
+                    )
             else:
-                # Create detailed T-slot profile based on variant
-                # 2020 profile dimensions (from 2020N2 spec):
-                # - 20x20mm outer
-                # - 6.1mm slot opening
-                # - 11mm T-track width
-                # - 5mm center bore
-                # - 1.5mm corner radius
-                size = 20.0
-                half = size / 2.0
-                slot_opening = 6.1  # Slot opening width
-                slot_depth = 1.8    # Depth to T-track
-                track_width = 11.0  # Internal T-track width
-                track_depth = 6.0   # Total slot depth from surface
-                bore_r = 2.5        # Center bore radius
-                corner_r = 1.5      # Corner radius
-                wall_t = 1.5        # Wall thickness
-                
-                # Determine which sides have slots based on variant
-                # Sides: 0=bottom (-Y), 1=right (+X), 2=top (+Y), 3=left (-X)
-                if variant == "2020":
-                    slot_sides = [0, 1, 2, 3]  # All 4 sides have slots
-                elif variant == "2020N1":
-                    # 1 sealed, 3 slots - sealed side rotated by sealed_rotation
-                    sealed_side = (sealed_rotation // 90) % 4
-                    slot_sides = [s for s in [0, 1, 2, 3] if s != sealed_side]
-                elif variant == "2020N2":
-                    # 2 adjacent sealed, 2 slots - forms a corner
-                    base = (sealed_rotation // 90) % 4
-                    sealed_sides = [base, (base + 1) % 4]
-                    slot_sides = [s for s in [0, 1, 2, 3] if s not in sealed_sides]
-                elif variant == "2020N3":
-                    # 3 sealed, 1 slot - only one side has slot
-                    slot_side = (sealed_rotation // 90) % 4
-                    slot_sides = [slot_side]
-                else:
-                    # Default to full 2020
-                    slot_sides = [0, 1, 2, 3]
-                
-                # Build the profile as a 2D wire then extrude
-                # Start with outer square and add T-slot cutouts
-                from math import sqrt
-                
-                # Create outer square profile
-                outer_wire = Part.makePolygon([
-                    FreeCAD.Vector(-half, -half, 0),
-                    FreeCAD.Vector(half, -half, 0),
-                    FreeCAD.Vector(half, half, 0),
-                    FreeCAD.Vector(-half, half, 0),
-                    FreeCAD.Vector(-half, -half, 0)
-                ])
-                outer_face = Part.Face(outer_wire)
-                
-                # Extrude the outer shape
-                solid = outer_face.extrude(FreeCAD.Vector(0, 0, length))
-                
-                # Cut center bore
-                bore = Part.makeCylinder(bore_r, length)
-                solid = solid.cut(bore)
-                
-                # Cut T-slots on active sides
-                slot_half = slot_opening / 2.0
-                track_half = track_width / 2.0
-                
-                for side in slot_sides:
-                    # Create T-slot cutout shape
-                    # T-slot: narrow opening, wider track inside
-                    if side == 0:  # Bottom (-Y)
-                        # Slot opening
-                        slot_box = Part.makeBox(
-                            slot_opening, slot_depth, length,
-                            FreeCAD.Vector(-slot_half, -half, 0)
-                        )
-                        # T-track (wider part inside)
-                        track_box = Part.makeBox(
-                            track_width, track_depth - slot_depth, length,
-                            FreeCAD.Vector(-track_half, -half + slot_depth, 0)
-                        )
-                        solid = solid.cut(slot_box)
-                        solid = solid.cut(track_box)
-                    elif side == 1:  # Right (+X)
-                        slot_box = Part.makeBox(
-                            slot_depth, slot_opening, length,
-                            FreeCAD.Vector(half - slot_depth, -slot_half, 0)
-                        )
-                        track_box = Part.makeBox(
-                            track_depth - slot_depth, track_width, length,
-                            FreeCAD.Vector(half - track_depth, -track_half, 0)
-                        )
-                        solid = solid.cut(slot_box)
-                        solid = solid.cut(track_box)
-                    elif side == 2:  # Top (+Y)
-                        slot_box = Part.makeBox(
-                            slot_opening, slot_depth, length,
-                            FreeCAD.Vector(-slot_half, half - slot_depth, 0)
-                        )
-                        track_box = Part.makeBox(
-                            track_width, track_depth - slot_depth, length,
-                            FreeCAD.Vector(-track_half, half - track_depth, 0)
-                        )
-                        solid = solid.cut(slot_box)
-                        solid = solid.cut(track_box)
-                    elif side == 3:  # Left (-X)
-                        slot_box = Part.makeBox(
-                            slot_depth, slot_opening, length,
-                            FreeCAD.Vector(-half, -slot_half, 0)
-                        )
-                        track_box = Part.makeBox(
-                            track_depth - slot_depth, track_width, length,
-                            FreeCAD.Vector(-half, -track_half, 0)
-                        )
-                        solid = solid.cut(slot_box)
-                        solid = solid.cut(track_box)
+                # Detailed T-slot profile: the cross-section is cached per
+                # variant/rotation and extruded once
+                key = (profile_variant, sealed_rotation % 360)
+                face = _PROFILE_FACE_CACHE.get(key)
+                if face is None:
+                    face = _PROFILE_FACE_CACHE[key] = _build_2020_face(*key)
+                solid = face.copy().extrude(FreeCAD.Vector(0, 0, length))
                 
                 # Create Part::Feature
                 obj = doc.addObject("Part::Feature", name)
                 obj.Shape = solid
                 
                 # Set placement and rotation based on direction
-                if direction.upper() == "Z":
-                    obj.Placement.Base = FreeCAD.Vector(pos_x, pos_y, pos_z)
-                elif direction.upper() == "Y":
-                    obj.Placement = FreeCAD.Placement(
-                        FreeCAD.Vector(pos_x, pos_y, pos_z),
-                        FreeCAD.Rotation(FreeCAD.Vector(1, 0, 0), 90)
-                    )
-                elif direction.upper() == "X":
-                    obj.Placement = FreeCAD.Placement(
-                        FreeCAD.Vector(pos_x, pos_y, pos_z),
-                        FreeCAD.Rotation(FreeCAD.Vector(0, 1, 0), -90)
-                    )
+                obj.Placement = _Placement(
+                    _Vector(pos_x, pos_y, pos_z), _EXTRUSION_ROTATIONS[direction]
+                )
             
-            # Apply color
-            if color and hasattr(obj, 'ViewObject') and obj.ViewObject:
-                obj.ViewObject.ShapeColor = tuple(color[:4] if len(color) >= 4 else color + [1.0])
-            elif hasattr(obj, 'ViewObject') and obj.ViewObject:
-                # Default aluminum gray
-                obj.ViewObject.ShapeColor = (0.7, 0.7, 0.75, 1.0)
+            # Apply color (default aluminum gray) and ensure visibility
+            if _HAS_GUI:
+                if color:
+                    shape_color = tuple(color[:4]) if len(color) >= 4 else tuple(color) + (1.0,)
+                else:
+                    shape_color = (0.7, 0.7, 0.75, 1.0)
+                vo = obj.ViewObject
+                vo.ShapeColor = shape_color
+                vo.Visibility = True
             
-            # Ensure visibility
-            if hasattr(obj, 'ViewObject') and obj.ViewObject:
-                obj.ViewObject.Visibility = True
-            
-            doc.recompute()
+            # Nothing else depends on a new profile, so the document needn't
+            # be recomputed: the detailed path already has its final Shape and
+            # the Box only needs its own shape built.
+            if simplified and not defer_recompute:
+                obj.recompute()
             
             FreeCAD.Console.PrintMessage(
                 f"2020 extrusion '{name}' created (length={length}mm, direction={direction}).\n"
@@ -1552,10 +2185,9 @@ class FreeCADRPC:
         Returns:
             Success status and update count
         """
-        rpc_request_queue.put(
+        res = dispatch_gui(
             lambda: self._batch_position_gui(doc_name, objects, offset, position, absolute)
         )
-        res = rpc_response_queue.get()
         if isinstance(res, str):
             return {"success": False, "error": res}
         return {"success": True, "updated_count": res["updated_count"], "message": res["message"]}
@@ -1574,8 +2206,25 @@ class FreeCADRPC:
             if not doc:
                 return f"Document '{doc_name}' not found."
             
-            updated_count = 0
+            if absolute and position:
+                # None keeps the object's current coordinate on that axis
+                abs_xyz = tuple(
+                    None if v is None else float(v)
+                    for v in (position.get("x"), position.get("y"), position.get("z"))
+                )
+                off = None
+            elif offset:
+                off = _Vector(
+                    float(offset.get("x", 0)),
+                    float(offset.get("y", 0)),
+                    float(offset.get("z", 0)),
+                )
+            else:
+                off = abs_xyz = None
+            
+            moved = []
             not_found = []
+            no_placement = []
             
             for obj_name in objects:
                 obj = doc.getObject(obj_name)
@@ -1583,43 +2232,45 @@ class FreeCADRPC:
                     not_found.append(obj_name)
                     continue
                 
-                if not hasattr(obj, 'Placement'):
-                    FreeCAD.Console.PrintWarning(
-                        f"Object '{obj_name}' has no Placement property, skipping.\n"
-                    )
+                placement = getattr(obj, "Placement", None)
+                if placement is None:
+                    no_placement.append(obj_name)
                     continue
                 
-                current = obj.Placement.Base
-                
-                if absolute and position:
-                    # Set absolute position
-                    new_pos = FreeCAD.Vector(
-                        position.get("x", current.x),
-                        position.get("y", current.y),
-                        position.get("z", current.z)
-                    )
-                elif offset:
-                    # Apply relative offset
-                    new_pos = FreeCAD.Vector(
-                        current.x + offset.get("x", 0),
-                        current.y + offset.get("y", 0),
-                        current.z + offset.get("z", 0)
-                    )
+                # obj.Placement hands back a copy; edit it and write it once,
+                # which keeps the rotation as is
+                if off is not None:
+                    placement.move(off)
+                elif abs_xyz is not None:
+                    base = placement.Base
+                    x, y, z = abs_xyz
+                    if x is not None:
+                        base.x = x
+                    if y is not None:
+                        base.y = y
+                    if z is not None:
+                        base.z = z
+                    placement.Base = base
                 else:
                     continue
                 
-                # Preserve rotation
-                obj.Placement = FreeCAD.Placement(
-                    new_pos,
-                    obj.Placement.Rotation
-                )
-                updated_count += 1
+                obj.Placement = placement
+                moved.append(obj)
             
-            doc.recompute()
+            recompute_moved(doc, moved)
+            updated_count = len(moved)
+            
+            if no_placement:
+                FreeCAD.Console.PrintWarning(
+                    f"Skipped {len(no_placement)} objects without a Placement property: "
+                    f"{', '.join(no_placement)}\n"
+                )
             
             msg = f"Updated {updated_count} of {len(objects)} objects"
             if not_found:
                 msg += f". Not found: {', '.join(not_found)}"
+            if no_placement:
+                msg += f". No Placement: {', '.join(no_placement)}"
             
             FreeCAD.Console.PrintMessage(msg + "\n")
             return {"updated_count": updated_count, "message": msg}
@@ -1629,50 +2280,161 @@ class FreeCADRPC:
             FreeCAD.Console.PrintError(error_msg + "\n")
             return error_msg
 
-    def _save_active_screenshot(self, save_path: str, view_name: str = "Isometric"):
+    def batch_set_positions(
+        self,
+        doc_name: str,
+        objects: list[str],
+        xs: list[float],
+        ys: list[float],
+        zs: list[float],
+        rotations: list[list[float]] = None
+    ) -> dict[str, Any]:
+        """Give each of several objects its own position in one call.
+
+        Args:
+            doc_name: Document name
+            objects: List of object names to reposition
+            xs: X coordinate per object, parallel to ``objects``
+            ys: Y coordinate per object, parallel to ``objects``
+            zs: Z coordinate per object, parallel to ``objects``
+            rotations: Optional quaternion [x, y, z, w] per object. Objects
+                keep their current rotation when omitted.
+        
+        Returns:
+            Success status, update count and one error string per rejected
+            entry (e.g. a rotation that is not four values)
+        """
+        count = len(objects)
+        if not (len(xs) == len(ys) == len(zs) == count) or (
+            rotations is not None and len(rotations) != count
+        ):
+            return {
+                "success": False,
+                "error": "xs, ys, zs and rotations must each have one entry per object",
+            }
+        res = dispatch_gui(
+            lambda: self._batch_set_positions_gui(doc_name, objects, xs, ys, zs, rotations)
+        )
+        if isinstance(res, str):
+            return {"success": False, "error": res}
+        return {
+            "success": True,
+            "updated_count": res["updated_count"],
+            "message": res["message"],
+            "errors": res["errors"],
+        }
+    
+    def _batch_set_positions_gui(
+        self,
+        doc_name: str,
+        objects: list[str],
+        xs: list[float],
+        ys: list[float],
+        zs: list[float],
+        rotations: list[list[float]] | None
+    ):
+        """Set per-object positions in GUI thread"""
+        try:
+            doc = FreeCAD.getDocument(doc_name)
+            if not doc:
+                return f"Document '{doc_name}' not found."
+            
+            if rotations is None:
+                rotations = [None] * len(objects)
+            
+            moved = []
+            not_found = []
+            no_placement = []
+            errors = []
+            
+            for obj_name, x, y, z, quat in zip(objects, xs, ys, zs, rotations):
+                # Rotation() reads three values as Euler angles, so anything
+                # but a full quaternion would silently rotate the wrong way
+                if quat is not None and len(quat) != 4:
+                    errors.append(
+                        f"{obj_name}: rotation must be a quaternion [x, y, z, w], got {len(quat)} values"
+                    )
+                    continue
+
+                obj = doc.getObject(obj_name)
+                if not obj:
+                    not_found.append(obj_name)
+                    continue
+                
+                placement = getattr(obj, "Placement", None)
+                if placement is None:
+                    no_placement.append(obj_name)
+                    continue
+                
+                placement.Base = _Vector(float(x), float(y), float(z))
+                if quat is not None:
+                    placement.Rotation = _Rotation(*(float(q) for q in quat))
+                obj.Placement = placement
+                moved.append(obj)
+            
+            recompute_moved(doc, moved)
+            updated_count = len(moved)
+            
+            if no_placement:
+                FreeCAD.Console.PrintWarning(
+                    f"Skipped {len(no_placement)} objects without a Placement property: "
+                    f"{', '.join(no_placement)}\n"
+                )
+            
+            msg = f"Updated {updated_count} of {len(objects)} objects"
+            if not_found:
+                msg += f". Not found: {', '.join(not_found)}"
+            if no_placement:
+                msg += f". No Placement: {', '.join(no_placement)}"
+            if errors:
+                msg += f". Errors: {'; '.join(errors)}"
+            
+            FreeCAD.Console.PrintMessage(msg + "\n")
+            return {"updated_count": updated_count, "message": msg, "errors": errors}
+            
+        except Exception as e:
+            error_msg = f"Failed to set positions: {str(e)}"
+            FreeCAD.Console.PrintError(error_msg + "\n")
+            return error_msg
+
+    def _capture_active_screenshot(self, view_name: str = "Isometric"):
         try:
             view = FreeCADGui.ActiveDocument.ActiveView
+            if view is None:
+                return "No active view available"
             # Check if the view supports screenshots
             if not hasattr(view, 'saveImage'):
                 return "Current view does not support screenshots"
 
-            if view_name == "Isometric":
-                view.viewIsometric()
-            elif view_name == "Front":
-                view.viewFront()
-            elif view_name == "Top":
-                view.viewTop()
-            elif view_name == "Right":
-                view.viewRight()
-            elif view_name == "Back":
-                view.viewBack()
-            elif view_name == "Left":
-                view.viewLeft()
-            elif view_name == "Bottom":
-                view.viewBottom()
-            elif view_name == "Dimetric":
-                view.viewDimetric()
-            elif view_name == "Trimetric":
-                view.viewTrimetric()
-            else:
-                raise ValueError(f"Invalid view name: {view_name}")
+            method_name = _VIEW_METHODS.get(view_name)
+            if method_name is None:
+                return f"Invalid view name: {view_name}"
+            getattr(view, method_name)()
             view.fitAll()
-            view.saveImage(save_path, 1)
-            return True
+            return grab_view_image(view)
         except Exception as e:
             return str(e)
 
 
 def start_rpc_server(host="localhost", port=9875):
-    global rpc_server_thread, rpc_server_instance
+    global rpc_server_thread, rpc_server_instance, gui_task_bridge
 
     if rpc_server_instance:
         return "RPC Server already running."
 
-    rpc_server_instance = SimpleXMLRPCServer(
-        (host, port), allow_none=True, logRequests=False
+    # Must be created on the GUI thread so queued signals are delivered there
+    gui_task_bridge = _TaskBridge()
+
+    rpc_server_instance = _ThreadedRPCServer(
+        (host, port),
+        requestHandler=_KeepAliveRequestHandler,
+        allow_none=True,
+        logRequests=False,
+        use_builtin_types=True,
     )
     rpc_server_instance.register_instance(FreeCADRPC())
+    # Lets clients send an action and its screenshot in one request
+    rpc_server_instance.register_multicall_functions()
 
     def server_loop():
         FreeCAD.Console.PrintMessage(f"RPC Server started at {host}:{port}\n")
@@ -1681,19 +2443,20 @@ def start_rpc_server(host="localhost", port=9875):
     rpc_server_thread = threading.Thread(target=server_loop, daemon=True)
     rpc_server_thread.start()
 
-    QtCore.QTimer.singleShot(500, process_gui_tasks)
-
     return f"RPC Server started at {host}:{port}."
 
 
 def stop_rpc_server():
-    global rpc_server_instance, rpc_server_thread
+    global rpc_server_instance, rpc_server_thread, gui_task_bridge
 
     if rpc_server_instance:
+        rpc_server_instance.stopped = True
         rpc_server_instance.shutdown()
+        rpc_server_instance.server_close()
         rpc_server_thread.join()
         rpc_server_instance = None
         rpc_server_thread = None
+        gui_task_bridge = None
         FreeCAD.Console.PrintMessage("RPC Server stopped.\n")
         return "RPC Server stopped."
 
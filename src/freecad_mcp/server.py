@@ -1,5 +1,9 @@
+import base64
+import hashlib
+import http.client
 import json
 import logging
+import time
 import xmlrpc.client
 from contextlib import asynccontextmanager
 from typing import AsyncIterator, Dict, Any, Literal
@@ -7,76 +11,166 @@ from typing import AsyncIterator, Dict, Any, Literal
 from mcp.server.fastmcp import FastMCP, Context
 from mcp.types import TextContent, ImageContent
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-)
+try:
+    import orjson
+except ImportError:
+    # Optional: faster JSON encoding of large object listings
+    orjson = None
+
 logger = logging.getLogger("FreeCADMCPserver")
 
 
 _only_text_feedback = False
+_screenshot_debounce_ms = 50
+_screenshot_max_dim = 0
+_screenshot_format = "png"
 
+# MIME type of the screenshots the addon returns in each format
+SCREENSHOT_MIME_TYPES = {"png": "image/png", "jpeg": "image/jpeg"}
 
-class FreeCADConnection:
-    def __init__(self, host: str = "localhost", port: int = 9875):
-        self.server = xmlrpc.client.ServerProxy(f"http://{host}:{port}", allow_none=True)
 
-    def ping(self) -> bool:
-        return self.server.ping()
+def dumps_json(data: Any) -> str:
+    """Serialize tool output to JSON, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(data).decode()
+    return json.dumps(data)
 
-    def create_document(self, name: str) -> dict[str, Any]:
-        return self.server.create_document(name)
+# Returned in place of a screenshot identical to the previous one sent
+SCREENSHOT_UNCHANGED = "unchanged"
 
-    def create_object(self, doc_name: str, obj_data: dict[str, Any]) -> dict[str, Any]:
-        return self.server.create_object(doc_name, obj_data)
+# Errors a call to the addon can raise: XML-RPC faults and protocol errors,
+# HTTP errors from a kept-alive connection the addon has dropped
+# (CannotSendRequest, BadStatusLine, ...), plus socket-level failures when
+# FreeCAD isn't reachable
+RPC_ERRORS = (xmlrpc.client.Error, http.client.HTTPException, OSError)
 
-    def edit_object(self, doc_name: str, obj_name: str, obj_data: dict[str, Any]) -> dict[str, Any]:
-        return self.server.edit_object(doc_name, obj_name, obj_data)
+# Object kinds create_primitives_batch accepts, each sent as create_<kind>
+PRIMITIVE_KINDS = ("box", "cylinder", "fastener")
 
-    def delete_object(self, doc_name: str, obj_name: str) -> dict[str, Any]:
-        return self.server.delete_object(doc_name, obj_name)
 
-    def insert_part_from_library(self, relative_path: str) -> dict[str, Any]:
-        return self.server.insert_part_from_library(relative_path)
+def encode_screenshot(image: bytes | str | None) -> str | None:
+    """Base64-encode a screenshot from the addon for ImageContent.
 
-    def execute_code(self, code: str) -> dict[str, Any]:
-        return self.server.execute_code(code)
+    The addon sends raw PNG bytes; older versions send an already
+    base64-encoded string, which is passed through.
+    """
+    if isinstance(image, bytes):
+        return base64.b64encode(image).decode("ascii")
+    return image
 
-    def get_active_screenshot(self, view_name: str = "Isometric") -> str | None:
-        try:
-            # Check if we're in a view that supports screenshots
-            result = self.server.execute_code("""
-import FreeCAD
-import FreeCADGui
 
-if FreeCAD.Gui.ActiveDocument and FreeCAD.Gui.ActiveDocument.ActiveView:
-    view_type = type(FreeCAD.Gui.ActiveDocument.ActiveView).__name__
-    
-    # These view types don't support screenshots
-    unsupported_views = ['SpreadsheetGui::SheetView', 'DrawingGui::DrawingView', 'TechDrawGui::MDIViewPage']
-    
-    if view_type in unsupported_views or not hasattr(FreeCAD.Gui.ActiveDocument.ActiveView, 'saveImage'):
-        print("Current view does not support screenshots")
-        False
-    else:
-        print(f"Current view supports screenshots: {view_type}")
-        True
-else:
-    print("No active view")
-    False
-""")
-
-            # If the view doesn't support screenshots, return None
-            if not result.get("success", False) or "Current view does not support screenshots" in result.get("message", ""):
-                logger.info("Screenshot unavailable in current view (likely Spreadsheet or TechDraw view)")
-                return None
-
-            # Otherwise, try to get the screenshot
-            return self.server.get_active_screenshot(view_name)
+class FreeCADConnection:
+    __slots__ = (
+        "server",
+        "screenshot_max_dim",
+        "screenshot_format",
+        "screenshot_debounce",
+        "_last_screenshot_digest",
+        "_screenshot_cache",
+    )
+
+    def __init__(
+        self,
+        host: str = "localhost",
+        port: int = 9875,
+        screenshot_max_dim: int = 0,
+        screenshot_format: str = "png",
+        screenshot_debounce_ms: int = 0,
+    ):
+        self.server = xmlrpc.client.ServerProxy(
+            f"http://{host}:{port}", allow_none=True, use_builtin_types=True
+        )
+        # Longest side of returned screenshots in pixels; 0 keeps full size
+        self.screenshot_max_dim = screenshot_max_dim
+        # "png" or "jpeg"
+        self.screenshot_format = screenshot_format
+        # Seconds a screenshot is reused by get_active_screenshot before the
+        # view is rendered again; 0 always renders
+        self.screenshot_debounce = screenshot_debounce_ms / 1000
+        self._last_screenshot_digest = None
+        # (time.monotonic(), view_name, image) of the latest capture
+        self._screenshot_cache = None
+
+    def _screenshot_args(self, view_name: str) -> tuple:
+        # Older addons don't take max_dim or image_format, so only send them
+        # when they differ from the defaults
+        if self.screenshot_format != "png":
+            return view_name, self.screenshot_max_dim, self.screenshot_format
+        if self.screenshot_max_dim:
+            return view_name, self.screenshot_max_dim
+        return (view_name,)
+
+    def _screenshot_result(self, image: bytes | str | None, skip_unchanged: bool) -> str | None:
+        """Encode ``image``, or return SCREENSHOT_UNCHANGED if it matches the last one."""
+        if isinstance(image, bytes):
+            digest = hashlib.blake2b(image, digest_size=16).digest()
+            unchanged = digest == self._last_screenshot_digest
+            self._last_screenshot_digest = digest
+            if unchanged and skip_unchanged:
+                return SCREENSHOT_UNCHANGED
+        return encode_screenshot(image)
+
+    def ping(self) -> bool:
+        return self.server.ping()
+
+    def disconnect(self) -> None:
+        """Close the kept-alive HTTP connection to the addon."""
+        self.server("close")()
+
+    def create_document(self, name: str) -> dict[str, Any]:
+        return self.server.create_document(name)
+
+    def call_with_screenshot(
+        self, method: str, *args, screenshot: bool = True
+    ) -> tuple[Any, str | None]:
+        """Call ``method`` and capture the active view in a single round trip.
+
+        Both calls go out as one system.multicall request. Returns the method's
+        result and the base64 PNG, None when no screenshot could be taken, or
+        SCREENSHOT_UNCHANGED when the view looks the same as in the last one.
+        With ``screenshot=False`` only the method is called and no view is
+        rendered.
+        """
+        if not screenshot:
+            self._screenshot_cache = None
+            return getattr(self.server, method)(*args), None
+        multi = xmlrpc.client.MultiCall(self.server)
+        getattr(multi, method)(*args)
+        multi.get_active_screenshot(*self._screenshot_args("Isometric"))
+        results = multi()
+        try:
+            image = results[1]
+        except xmlrpc.client.Fault as e:
+            logger.error("Error getting screenshot: %s", e)
+            image = None
+        # The action may have changed the scene, so this capture replaces any cached one
+        self._screenshot_cache = (time.monotonic(), "Isometric", image)
+        return results[0], self._screenshot_result(image, skip_unchanged=True)
+
+    def get_active_screenshot(
+        self, view_name: str = "Isometric", skip_unchanged: bool = False
+    ) -> str | None:
+        cached = self._screenshot_cache
+        if (
+            cached is not None
+            and cached[1] == view_name
+            and time.monotonic() - cached[0] < self.screenshot_debounce
+        ):
+            # A capture from a moment ago; skip rendering the view again
+            return self._screenshot_result(cached[2], skip_unchanged)
+        try:
+            # The addon checks the active view itself and returns None when it
+            # can't be captured (e.g. Spreadsheet or TechDraw views)
+            image = self.server.get_active_screenshot(*self._screenshot_args(view_name))
         except Exception as e:
-            # Log the error but return None instead of raising an exception
-            logger.error(f"Error getting screenshot: {e}")
+            # Deliberately broad: a missing screenshot must never fail the
+            # tool it accompanies. Log the error and return None instead.
+            logger.error("Error getting screenshot: %s", e)
             return None
+        self._screenshot_cache = (time.monotonic(), view_name, image)
+        if image is None:
+            logger.info("Screenshot unavailable in current view (likely Spreadsheet or TechDraw view)")
+        return self._screenshot_result(image, skip_unchanged)
 
     def get_objects(self, doc_name: str) -> list[dict[str, Any]]:
         return self.server.get_objects(doc_name)
@@ -84,131 +178,20 @@ else:
     def get_object(self, doc_name: str, obj_name: str) -> dict[str, Any]:
         return self.server.get_object(doc_name, obj_name)
 
+    def get_objects_names(self, doc_name: str) -> list[str]:
+        return self.server.get_objects_names(doc_name)
+
+    def get_objects_page(
+        self, doc_name: str, offset: int = 0, limit: int = 100
+    ) -> list[dict[str, Any]]:
+        return self.server.get_objects_page(doc_name, offset, limit)
+
     def get_parts_list(self) -> list[str]:
         return self.server.get_parts_list()
 
     def activate_workbench(self, workbench_name: str) -> dict[str, Any]:
         return self.server.activate_workbench(workbench_name)
 
-    def boolean_operation(
-        self,
-        doc_name: str,
-        operation: str,
-        base_obj_name: str,
-        tool_obj_name: str,
-        result_name: str = None,
-        keep_originals: bool = False
-    ) -> dict[str, Any]:
-        return self.server.boolean_operation(
-            doc_name, operation, base_obj_name, tool_obj_name, result_name, keep_originals
-        )
-
-    def create_box(
-        self,
-        doc_name: str,
-        name: str,
-        length: float,
-        width: float,
-        height: float,
-        position: dict[str, float] = None,
-        color: list[float] = None
-    ) -> dict[str, Any]:
-        return self.server.create_box(doc_name, name, length, width, height, position, color)
-
-    def create_cylinder(
-        self,
-        doc_name: str,
-        name: str,
-        radius: float,
-        height: float,
-        position: dict[str, float] = None,
-        direction: dict[str, float] = None,
-        color: list[float] = None
-    ) -> dict[str, Any]:
-        return self.server.create_cylinder(doc_name, name, radius, height, position, direction, color)
-
-    def create_fastener(
-        self,
-        doc_name: str,
-        name: str,
-        fastener_type: str,
-        position: dict[str, float] = None,
-        attach_to: str = None,
-        diameter: str = "M4",
-        length: str = "10"
-    ) -> dict[str, Any]:
-        return self.server.create_fastener(doc_name, name, fastener_type, position, attach_to, diameter, length)
-
-    # ============================================================
-    # NEW SKETCH AND EXTRUSION METHODS
-    # ============================================================
-    
-    def create_sketch(
-        self,
-        doc_name: str,
-        name: str,
-        plane: str = "XY",
-        origin: dict[str, float] = None,
-        body_name: str = None
-    ) -> dict[str, Any]:
-        return self.server.create_sketch(doc_name, name, plane, origin, body_name)
-    
-    def add_sketch_geometry(
-        self,
-        doc_name: str,
-        sketch_name: str,
-        geometry: list[dict[str, Any]],
-        construction: bool = False
-    ) -> dict[str, Any]:
-        return self.server.add_sketch_geometry(doc_name, sketch_name, geometry, construction)
-    
-    def add_sketch_constraints(
-        self,
-        doc_name: str,
-        sketch_name: str,
-        constraints: list[dict[str, Any]]
-    ) -> dict[str, Any]:
-        return self.server.add_sketch_constraints(doc_name, sketch_name, constraints)
-    
-    def create_extrusion(
-        self,
-        doc_name: str,
-        name: str,
-        sketch_name: str,
-        length: float,
-        symmetric: bool = False,
-        reversed: bool = False,
-        body_name: str = None
-    ) -> dict[str, Any]:
-        return self.server.create_extrusion(doc_name, name, sketch_name, length, symmetric, reversed, body_name)
-    
-    def create_2020_extrusion(
-        self,
-        doc_name: str,
-        name: str,
-        length: float,
-        position: dict[str, float] = None,
-        direction: str = "Z",
-        color: list[float] = None,
-        simplified: bool = True,
-        profile_variant: str = "2020",
-        sealed_rotation: int = 0
-    ) -> dict[str, Any]:
-        return self.server.create_2020_extrusion(
-            doc_name, name, length, position, direction, color, simplified,
-            profile_variant, sealed_rotation
-        )
-    
-    def batch_position(
-        self,
-        doc_name: str,
-        objects: list[str],
-        offset: dict[str, float] = None,
-        position: dict[str, float] = None,
-        absolute: bool = False
-    ) -> dict[str, Any]:
-        return self.server.batch_position(doc_name, objects, offset, position, absolute)
-
 
 @asynccontextmanager
 async def server_lifespan(server: FastMCP) -> AsyncIterator[Dict[str, Any]]:
@@ -217,8 +200,8 @@ async def server_lifespan(server: FastMCP) -> AsyncIterator[Dict[str, Any]]:
         try:
             _ = get_freecad_connection()
             logger.info("Successfully connected to FreeCAD on startup")
-        except Exception as e:
-            logger.warning(f"Could not connect to FreeCAD on startup: {str(e)}")
+        except RPC_ERRORS as e:
+            logger.warning("Could not connect to FreeCAD on startup: %s", e)
             logger.warning(
                 "Make sure the FreeCAD addon is running before using FreeCAD resources or tools"
             )
@@ -247,31 +230,76 @@ def get_freecad_connection():
     """Get or create a persistent FreeCAD connection"""
     global _freecad_connection
     if _freecad_connection is None:
-        _freecad_connection = FreeCADConnection(host="localhost", port=9875)
+        _freecad_connection = FreeCADConnection(
+            host="localhost",
+            port=9875,
+            screenshot_max_dim=_screenshot_max_dim,
+            screenshot_format=_screenshot_format,
+            screenshot_debounce_ms=_screenshot_debounce_ms,
+        )
         if not _freecad_connection.ping():
             logger.error("Failed to ping FreeCAD")
             _freecad_connection = None
-            raise Exception(
+            raise ConnectionError(
                 "Failed to connect to FreeCAD. Make sure the FreeCAD addon is running."
             )
     return _freecad_connection
 
 
+# Fixed notes that stand in for a screenshot; built once and shared by every response
+_SCREENSHOT_UNCHANGED_NOTE = TextContent(
+    type="text", text="The view is unchanged since the previous screenshot."
+)
+# Informative message that will be seen by the AI model and user
+_SCREENSHOT_UNAVAILABLE_NOTE = TextContent(
+    type="text",
+    text="Note: Visual preview is unavailable in the current view type (such as TechDraw or Spreadsheet). "
+         "Switch to a 3D view to see visual feedback."
+)
+
+
 # Helper function to safely add screenshot to response
 def add_screenshot_if_available(response, screenshot):
     """Safely add screenshot to response only if it's available"""
-    if screenshot is not None and not _only_text_feedback:
-        response.append(ImageContent(type="image", data=screenshot, mimeType="image/png"))
-    elif not _only_text_feedback:
-        # Add an informative message that will be seen by the AI model and user
-        response.append(TextContent(
-            type="text", 
-            text="Note: Visual preview is unavailable in the current view type (such as TechDraw or Spreadsheet). "
-                 "Switch to a 3D view to see visual feedback."
-        ))
+    if _only_text_feedback:
+        return response
+    if screenshot is None:
+        response.append(_SCREENSHOT_UNAVAILABLE_NOTE)
+    elif screenshot is SCREENSHOT_UNCHANGED:
+        response.append(_SCREENSHOT_UNCHANGED_NOTE)
+    else:
+        response.append(
+            ImageContent(
+                type="image", data=screenshot, mimeType=SCREENSHOT_MIME_TYPES[_screenshot_format]
+            )
+        )
     return response
 
 
+def screenshot_tool_response(action: str, success, method: str, *args) -> list[TextContent | ImageContent]:
+    """Call an addon method with a screenshot and build the tool's response.
+
+    Args:
+        action: What the tool does, used in failure messages (e.g. "create box")
+        success: Builds the success message from the method's result dict
+        method: Name of the addon RPC method
+        *args: Positional arguments for ``method``
+
+    Returns:
+        The success or failure message, followed by the screenshot if available.
+    """
+    freecad = get_freecad_connection()
+    try:
+        res, screenshot = freecad.call_with_screenshot(
+            method, *args, screenshot=not _only_text_feedback
+        )
+        text = success(res) if res["success"] else f"Failed to {action}: {res['error']}"
+    except RPC_ERRORS as e:
+        logger.error("Failed to %s: %s", action, e)
+        return [TextContent(type="text", text=f"Failed to {action}: {str(e)}")]
+    return add_screenshot_if_available([TextContent(type="text", text=text)], screenshot)
+
+
 @mcp.tool()
 def create_document(ctx: Context, name: str) -> list[TextContent]:
     """Create a new document in FreeCAD.
@@ -301,8 +329,8 @@ def create_document(ctx: Context, name: str) -> list[TextContent]:
             return [
                 TextContent(type="text", text=f"Failed to create document: {res['error']}")
             ]
-    except Exception as e:
-        logger.error(f"Failed to create document: {str(e)}")
+    except RPC_ERRORS as e:
+        logger.error("Failed to create document: %s", e)
         return [
             TextContent(type="text", text=f"Failed to create document: {str(e)}")
         ]
@@ -432,27 +460,13 @@ def create_object(
         }
         ```
     """
-    freecad = get_freecad_connection()
-    try:
-        obj_data = {"Name": obj_name, "Type": obj_type, "Properties": obj_properties or {}, "Analysis": analysis_name}
-        res = freecad.create_object(doc_name, obj_data)
-        screenshot = freecad.get_active_screenshot()
-        
-        if res["success"]:
-            response = [
-                TextContent(type="text", text=f"Object '{res['object_name']}' created successfully"),
-            ]
-            return add_screenshot_if_available(response, screenshot)
-        else:
-            response = [
-                TextContent(type="text", text=f"Failed to create object: {res['error']}"),
-            ]
-            return add_screenshot_if_available(response, screenshot)
-    except Exception as e:
-        logger.error(f"Failed to create object: {str(e)}")
-        return [
-            TextContent(type="text", text=f"Failed to create object: {str(e)}")
-        ]
+    obj_data = {"Name": obj_name, "Type": obj_type, "Properties": obj_properties or {}, "Analysis": analysis_name}
+
+    return screenshot_tool_response(
+        "create object",
+        lambda res: f"Object '{res['object_name']}' created successfully",
+        "create_object", doc_name, obj_data
+    )
 
 
 @mcp.tool()
@@ -470,26 +484,11 @@ def edit_object(
     Returns:
         A message indicating the success or failure of the object editing and a screenshot of the object.
     """
-    freecad = get_freecad_connection()
-    try:
-        res = freecad.edit_object(doc_name, obj_name, {"Properties": obj_properties})
-        screenshot = freecad.get_active_screenshot()
-
-        if res["success"]:
-            response = [
-                TextContent(type="text", text=f"Object '{res['object_name']}' edited successfully"),
-            ]
-            return add_screenshot_if_available(response, screenshot)
-        else:
-            response = [
-                TextContent(type="text", text=f"Failed to edit object: {res['error']}"),
-            ]
-            return add_screenshot_if_available(response, screenshot)
-    except Exception as e:
-        logger.error(f"Failed to edit object: {str(e)}")
-        return [
-            TextContent(type="text", text=f"Failed to edit object: {str(e)}")
-        ]
+    return screenshot_tool_response(
+        "edit object",
+        lambda res: f"Object '{res['object_name']}' edited successfully",
+        "edit_object", doc_name, obj_name, {"Properties": obj_properties}
+    )
 
 
 @mcp.tool()
@@ -503,26 +502,11 @@ def delete_object(ctx: Context, doc_name: str, obj_name: str) -> list[TextConten
     Returns:
         A message indicating the success or failure of the object deletion and a screenshot of the object.
     """
-    freecad = get_freecad_connection()
-    try:
-        res = freecad.delete_object(doc_name, obj_name)
-        screenshot = freecad.get_active_screenshot()
-        
-        if res["success"]:
-            response = [
-                TextContent(type="text", text=f"Object '{res['object_name']}' deleted successfully"),
-            ]
-            return add_screenshot_if_available(response, screenshot)
-        else:
-            response = [
-                TextContent(type="text", text=f"Failed to delete object: {res['error']}"),
-            ]
-            return add_screenshot_if_available(response, screenshot)
-    except Exception as e:
-        logger.error(f"Failed to delete object: {str(e)}")
-        return [
-            TextContent(type="text", text=f"Failed to delete object: {str(e)}")
-        ]
+    return screenshot_tool_response(
+        "delete object",
+        lambda res: f"Object '{res['object_name']}' deleted successfully",
+        "delete_object", doc_name, obj_name
+    )
 
 
 @mcp.tool()
@@ -535,26 +519,11 @@ def execute_code(ctx: Context, code: str) -> list[TextContent | ImageContent]:
     Returns:
         A message indicating the success or failure of the code execution, the output of the code execution, and a screenshot of the object.
     """
-    freecad = get_freecad_connection()
-    try:
-        res = freecad.execute_code(code)
-        screenshot = freecad.get_active_screenshot()
-        
-        if res["success"]:
-            response = [
-                TextContent(type="text", text=f"Code executed successfully: {res['message']}"),
-            ]
-            return add_screenshot_if_available(response, screenshot)
-        else:
-            response = [
-                TextContent(type="text", text=f"Failed to execute code: {res['error']}"),
-            ]
-            return add_screenshot_if_available(response, screenshot)
-    except Exception as e:
-        logger.error(f"Failed to execute code: {str(e)}")
-        return [
-            TextContent(type="text", text=f"Failed to execute code: {str(e)}")
-        ]
+    return screenshot_tool_response(
+        "execute code",
+        lambda res: f"Code executed successfully: {res['message']}",
+        "execute_code", code, True
+    )
 
 
 @mcp.tool()
@@ -581,7 +550,11 @@ def get_view(ctx: Context, view_name: Literal["Isometric", "Front", "Top", "Righ
     screenshot = freecad.get_active_screenshot(view_name)
     
     if screenshot is not None:
-        return [ImageContent(type="image", data=screenshot, mimeType="image/png")]
+        return [
+            ImageContent(
+                type="image", data=screenshot, mimeType=SCREENSHOT_MIME_TYPES[_screenshot_format]
+            )
+        ]
     else:
         return [TextContent(type="text", text="Cannot get screenshot in the current view type (such as TechDraw or Spreadsheet)")]
 
@@ -596,53 +569,70 @@ def insert_part_from_library(ctx: Context, relative_path: str) -> list[TextConte
     Returns:
         A message indicating the success or failure of the part insertion and a screenshot of the object.
     """
-    freecad = get_freecad_connection()
-    try:
-        res = freecad.insert_part_from_library(relative_path)
-        screenshot = freecad.get_active_screenshot()
-        
-        if res["success"]:
-            response = [
-                TextContent(type="text", text=f"Part inserted from library: {res['message']}"),
-            ]
-            return add_screenshot_if_available(response, screenshot)
-        else:
-            response = [
-                TextContent(type="text", text=f"Failed to insert part from library: {res['error']}"),
-            ]
-            return add_screenshot_if_available(response, screenshot)
-    except Exception as e:
-        logger.error(f"Failed to insert part from library: {str(e)}")
-        return [
-            TextContent(type="text", text=f"Failed to insert part from library: {str(e)}")
-        ]
+    return screenshot_tool_response(
+        "insert part from library",
+        lambda res: f"Part inserted from library: {res['message']}",
+        "insert_part_from_library", relative_path
+    )
 
 
 @mcp.tool()
-def get_objects(ctx: Context, doc_name: str) -> list[dict[str, Any]]:
+def get_objects(
+    ctx: Context, doc_name: str, offset: int = 0, limit: int | None = None
+) -> list[dict[str, Any]]:
     """Get all objects in a document.
     You can use this tool to get the objects in a document to see what you can check or edit.
 
     Args:
         doc_name: The name of the document to get the objects from.
+        offset: Index of the first object to return (used with limit).
+        limit: Maximum number of objects to return. Returns all objects if omitted.
 
     Returns:
         A list of objects in the document and a screenshot of the document.
     """
     freecad = get_freecad_connection()
     try:
-        screenshot = freecad.get_active_screenshot()
+        screenshot = (
+            None if _only_text_feedback else freecad.get_active_screenshot(skip_unchanged=True)
+        )
+        if limit is None:
+            objects = freecad.get_objects(doc_name)
+        else:
+            objects = freecad.get_objects_page(doc_name, offset, limit)
         response = [
-            TextContent(type="text", text=json.dumps(freecad.get_objects(doc_name))),
+            TextContent(type="text", text=dumps_json(objects)),
         ]
         return add_screenshot_if_available(response, screenshot)
-    except Exception as e:
-        logger.error(f"Failed to get objects: {str(e)}")
+    except RPC_ERRORS as e:
+        logger.error("Failed to get objects: %s", e)
         return [
             TextContent(type="text", text=f"Failed to get objects: {str(e)}")
         ]
 
 
+@mcp.tool()
+def get_object_names(ctx: Context, doc_name: str) -> list[TextContent]:
+    """Get the names of all objects in a document, without their properties.
+    Much cheaper than get_objects for large documents.
+
+    Args:
+        doc_name: The name of the document to list.
+
+    Returns:
+        A JSON list of object names.
+    """
+    freecad = get_freecad_connection()
+    try:
+        names = freecad.get_objects_names(doc_name)
+        return [TextContent(type="text", text=dumps_json(names))]
+    except RPC_ERRORS as e:
+        logger.error("Failed to get object names: %s", e)
+        return [
+            TextContent(type="text", text=f"Failed to get object names: {str(e)}")
+        ]
+
+
 @mcp.tool()
 def get_object(ctx: Context, doc_name: str, obj_name: str) -> dict[str, Any]:
     """Get an object from a document.
@@ -657,13 +647,15 @@ def get_object(ctx: Context, doc_name: str, obj_name: str) -> dict[str, Any]:
     """
     freecad = get_freecad_connection()
     try:
-        screenshot = freecad.get_active_screenshot()
+        screenshot = (
+            None if _only_text_feedback else freecad.get_active_screenshot(skip_unchanged=True)
+        )
         response = [
-            TextContent(type="text", text=json.dumps(freecad.get_object(doc_name, obj_name))),
+            TextContent(type="text", text=dumps_json(freecad.get_object(doc_name, obj_name))),
         ]
         return add_screenshot_if_available(response, screenshot)
-    except Exception as e:
-        logger.error(f"Failed to get object: {str(e)}")
+    except RPC_ERRORS as e:
+        logger.error("Failed to get object: %s", e)
         return [
             TextContent(type="text", text=f"Failed to get object: {str(e)}")
         ]
@@ -677,7 +669,7 @@ def get_parts_list(ctx: Context) -> list[str]:
     parts = freecad.get_parts_list()
     if parts:
         return [
-            TextContent(type="text", text=json.dumps(parts))
+            TextContent(type="text", text=dumps_json(parts))
         ]
     else:
         return [
@@ -742,8 +734,8 @@ def activate_workbench(ctx: Context, workbench_name: str) -> list[TextContent]:
             return [
                 TextContent(type="text", text=f"Failed to activate workbench: {res['error']}")
             ]
-    except Exception as e:
-        logger.error(f"Failed to activate workbench: {str(e)}")
+    except RPC_ERRORS as e:
+        logger.error("Failed to activate workbench: %s", e)
         return [
             TextContent(type="text", text=f"Failed to activate workbench: {str(e)}")
         ]
@@ -814,32 +806,15 @@ def boolean_operation(
         }
         ```
     """
-    freecad = get_freecad_connection()
-    try:
-        res = freecad.boolean_operation(
-            doc_name, operation, base_obj_name, tool_obj_name, result_name, keep_originals
-        )
-        screenshot = freecad.get_active_screenshot()
-
-        if res["success"]:
-            response = [
-                TextContent(
-                    type="text",
-                    text=f"Boolean operation '{operation}' completed successfully. "
-                         f"Result object: '{res['result_object']}'"
-                )
-            ]
-            return add_screenshot_if_available(response, screenshot)
-        else:
-            response = [
-                TextContent(type="text", text=f"Failed to perform boolean operation: {res['error']}")
-            ]
-            return add_screenshot_if_available(response, screenshot)
-    except Exception as e:
-        logger.error(f"Failed to perform boolean operation: {str(e)}")
-        return [
-            TextContent(type="text", text=f"Failed to perform boolean operation: {str(e)}")
-        ]
+    return screenshot_tool_response(
+        "perform boolean operation",
+        lambda res: (
+            f"Boolean operation '{operation}' completed successfully. "
+            f"Result object: '{res['result_object']}'"
+        ),
+        "boolean_operation",
+        doc_name, operation, base_obj_name, tool_obj_name, result_name, keep_originals
+    )
 
 
 @mcp.tool()
@@ -856,7 +831,8 @@ def create_box(
     color_r: float = None,
     color_g: float = None,
     color_b: float = None,
-    color_a: float = 1.0
+    color_a: float = 1.0,
+    defer_recompute: bool = False
 ) -> list[TextContent | ImageContent]:
     """Create a box with simplified parameters.
 
@@ -876,6 +852,8 @@ def create_box(
         color_g: Green component 0.0-1.0 (optional).
         color_b: Blue component 0.0-1.0 (optional).
         color_a: Alpha component 0.0-1.0 (default: 1.0).
+        defer_recompute: Skip the document recompute so several parts can be
+            created quickly; call recompute once afterwards (default: False).
 
     Returns:
         A message indicating success or failure and a screenshot.
@@ -909,35 +887,19 @@ def create_box(
         }
         ```
     """
-    freecad = get_freecad_connection()
-    try:
-        position = {"x": position_x, "y": position_y, "z": position_z}
-        color = None
-        if color_r is not None and color_g is not None and color_b is not None:
-            color = [color_r, color_g, color_b, color_a]
-
-        res = freecad.create_box(doc_name, name, length, width, height, position, color)
-        screenshot = freecad.get_active_screenshot()
+    position = (position_x, position_y, position_z)
+    color = None
+    if color_r is not None and color_g is not None and color_b is not None:
+        color = (color_r, color_g, color_b, color_a)
 
-        if res["success"]:
-            response = [
-                TextContent(
-                    type="text",
-                    text=f"Box '{res['object_name']}' created successfully "
-                         f"(L={length}, W={width}, H={height} mm)"
-                )
-            ]
-            return add_screenshot_if_available(response, screenshot)
-        else:
-            response = [
-                TextContent(type="text", text=f"Failed to create box: {res['error']}")
-            ]
-            return add_screenshot_if_available(response, screenshot)
-    except Exception as e:
-        logger.error(f"Failed to create box: {str(e)}")
-        return [
-            TextContent(type="text", text=f"Failed to create box: {str(e)}")
-        ]
+    return screenshot_tool_response(
+        "create box",
+        lambda res: (
+            f"Box '{res['object_name']}' created successfully "
+            f"(L={length}, W={width}, H={height} mm)"
+        ),
+        "create_box", doc_name, name, length, width, height, position, color, defer_recompute
+    )
 
 
 @mcp.tool()
@@ -953,7 +915,8 @@ def create_cylinder(
     color_r: float = None,
     color_g: float = None,
     color_b: float = None,
-    color_a: float = 1.0
+    color_a: float = 1.0,
+    defer_recompute: bool = False
 ) -> list[TextContent | ImageContent]:
     """Create a cylinder with simplified parameters.
 
@@ -973,6 +936,8 @@ def create_cylinder(
         color_g: Green component 0.0-1.0 (optional).
         color_b: Blue component 0.0-1.0 (optional).
         color_a: Alpha component 0.0-1.0 (default: 1.0).
+        defer_recompute: Skip the document recompute so several parts can be
+            created quickly; call recompute once afterwards (default: False).
 
     Returns:
         A message indicating success or failure and a screenshot.
@@ -1004,35 +969,20 @@ def create_cylinder(
         }
         ```
     """
-    freecad = get_freecad_connection()
-    try:
-        position = {"x": position_x, "y": position_y, "z": position_z}
-        color = None
-        if color_r is not None and color_g is not None and color_b is not None:
-            color = [color_r, color_g, color_b, color_a]
-
-        res = freecad.create_cylinder(doc_name, name, radius, height, position, None, color)
-        screenshot = freecad.get_active_screenshot()
-
-        if res["success"]:
-            response = [
-                TextContent(
-                    type="text",
-                    text=f"Cylinder '{res['object_name']}' created successfully "
-                         f"(R={radius}, H={height} mm)"
-                )
-            ]
-            return add_screenshot_if_available(response, screenshot)
-        else:
-            response = [
-                TextContent(type="text", text=f"Failed to create cylinder: {res['error']}")
-            ]
-            return add_screenshot_if_available(response, screenshot)
-    except Exception as e:
-        logger.error(f"Failed to create cylinder: {str(e)}")
-        return [
-            TextContent(type="text", text=f"Failed to create cylinder: {str(e)}")
-        ]
+    position = (position_x, position_y, position_z)
+    color = None
+    if color_r is not None and color_g is not None and color_b is not None:
+        color = (color_r, color_g, color_b, color_a)
+
+    return screenshot_tool_response(
+        "create cylinder",
+        lambda res: (
+            f"Cylinder '{res['object_name']}' created successfully "
+            f"(R={radius}, H={height} mm)"
+        ),
+        "create_cylinder", doc_name, name, radius, height, position, None, color,
+        defer_recompute
+    )
 
 
 @mcp.tool()
@@ -1046,7 +996,8 @@ def create_fastener(
     position_z: float = 0,
     attach_to: str = None,
     diameter: str = "M4",
-    length: str = "10"
+    length: str = "10",
+    defer_recompute: bool = False
 ) -> list[TextContent | ImageContent]:
     """Create a fastener (screw, bolt, nut) using the Fasteners Workbench.
 
@@ -1070,6 +1021,8 @@ def create_fastener(
         attach_to: Optional name of object to attach the fastener to (default: None).
         diameter: Fastener diameter as string (e.g., "M3", "M4", "M5", "M6", "M8") (default: "M4").
         length: Fastener length in mm as string (e.g., "6", "8", "10", "12", "16", "20") (default: "10").
+        defer_recompute: Skip the document recompute so several parts can be
+            created quickly; call recompute once afterwards (default: False).
 
     Returns:
         A message indicating success or failure and a screenshot.
@@ -1114,34 +1067,123 @@ def create_fastener(
         The Fasteners Workbench will be automatically activated when using this tool.
         If the workbench is not installed, the tool will return an error with installation instructions.
     """
+    position = (position_x, position_y, position_z)
+
+    return screenshot_tool_response(
+        "create fastener",
+        lambda res: (
+            f"Fastener '{res['object_name']}' created successfully "
+            f"(Type: {fastener_type}, Size: {diameter}×{length}mm)"
+        ),
+        "create_fastener",
+        doc_name, name, fastener_type, position, attach_to, diameter, length, defer_recompute
+    )
+
+
+@mcp.tool()
+def recompute(ctx: Context, doc_name: str) -> list[TextContent | ImageContent]:
+    """Recompute a document.
+
+    Call this once after creating parts with defer_recompute=True so their
+    shapes are built.
+
+    Args:
+        doc_name: The name of the document to recompute.
+
+    Returns:
+        A message indicating success or failure and a screenshot.
+    """
+    return screenshot_tool_response(
+        "recompute document",
+        lambda res: f"Document '{doc_name}' recomputed",
+        "recompute", doc_name
+    )
+
+
+@mcp.tool()
+def create_primitives_batch(
+    ctx: Context,
+    doc_name: str,
+    items: list[dict[str, Any]]
+) -> list[TextContent | ImageContent]:
+    """Create many boxes, cylinders and fasteners in one operation.
+
+    Much faster than calling create_box, create_cylinder or create_fastener once
+    per part: all items are sent in a single request, the document is recomputed
+    once and only one screenshot is taken at the end.
+
+    Args:
+        doc_name: The name of the document to create the objects in.
+        items: One dict per object. ``kind`` is "box", "cylinder" or "fastener";
+            the other keys are that tool's arguments without ``doc_name``, with
+            ``position`` given as {"x", "y", "z"} or [x, y, z] instead of
+            position_x/position_y/position_z:
+            - box: name, length, width, height, position, color
+            - cylinder: name, radius, height, position, direction, color
+            - fastener: name, fastener_type, position, attach_to, diameter, length
+
+    Returns:
+        A message per item and a screenshot.
+
+    Examples:
+        Add a plate with four M4 thumbscrews:
+        ```json
+        {
+            "doc_name": "USFF_Tray",
+            "items": [
+                {"kind": "box", "name": "Plate", "length": 100, "width": 60, "height": 3},
+                {"kind": "fastener", "name": "Screw_1", "fastener_type": "DIN464", "position": [5, 5, 3]},
+                {"kind": "fastener", "name": "Screw_2", "fastener_type": "DIN464", "position": [95, 5, 3]},
+                {"kind": "fastener", "name": "Screw_3", "fastener_type": "DIN464", "position": [5, 55, 3]},
+                {"kind": "fastener", "name": "Screw_4", "fastener_type": "DIN464", "position": [95, 55, 3]}
+            ]
+        }
+        ```
+    """
+    calls = [
+        {
+            "method": f"create_{item['kind']}",
+            "args": {k: v for k, v in item.items() if k != "kind"},
+        }
+        for item in items
+        if item.get("kind") in PRIMITIVE_KINDS
+    ]
     freecad = get_freecad_connection()
     try:
-        position = {"x": position_x, "y": position_y, "z": position_z}
-
-        res = freecad.create_fastener(
-            doc_name, name, fastener_type, position, attach_to, diameter, length
+        res, screenshot = freecad.call_with_screenshot(
+            "execute_batch", doc_name, calls, screenshot=not _only_text_feedback
         )
-        screenshot = freecad.get_active_screenshot()
 
         if res["success"]:
-            response = [
-                TextContent(
-                    type="text",
-                    text=f"Fastener '{res['object_name']}' created successfully "
-                         f"(Type: {fastener_type}, Size: {diameter}×{length}mm)"
-                )
+            # Items with an unsupported kind were never sent; report them in place
+            batch_results = iter(res["results"])
+            results = [
+                next(batch_results)
+                if spec.get("kind") in PRIMITIVE_KINDS
+                else {
+                    "success": False,
+                    "error": f"Unsupported kind '{spec.get('kind')}'; "
+                             f"use one of {', '.join(PRIMITIVE_KINDS)}",
+                }
+                for spec in items
             ]
-            return add_screenshot_if_available(response, screenshot)
+            created = sum(item["success"] for item in results)
+            lines = [f"Created {created} of {len(items)} objects"]
+            for spec, item in zip(items, results):
+                name = item.get("object_name", spec.get("name"))
+                if item["success"]:
+                    lines.append(f"- {spec.get('kind')} '{name}' created")
+                else:
+                    lines.append(f"- '{name}' failed: {item['error']}")
+            response = [TextContent(type="text", text="\n".join(lines))]
         else:
             response = [
-                TextContent(type="text", text=f"Failed to create fastener: {res['error']}")
+                TextContent(type="text", text=f"Failed to create primitives: {res['error']}")
             ]
-            return add_screenshot_if_available(response, screenshot)
-    except Exception as e:
-        logger.error(f"Failed to create fastener: {str(e)}")
-        return [
-            TextContent(type="text", text=f"Failed to create fastener: {str(e)}")
-        ]
+        return add_screenshot_if_available(response, screenshot)
+    except RPC_ERRORS as e:
+        logger.error("Failed to create primitives: %s", e)
+        return [TextContent(type="text", text=f"Failed to create primitives: {str(e)}")]
 
 
 # ============================================================
@@ -1198,31 +1240,16 @@ def create_sketch(
         }
         ```
     """
-    freecad = get_freecad_connection()
-    try:
-        origin = {"x": origin_x, "y": origin_y, "z": origin_z}
-        res = freecad.create_sketch(doc_name, name, plane, origin, body_name)
-        screenshot = freecad.get_active_screenshot()
+    origin = (origin_x, origin_y, origin_z)
 
-        if res["success"]:
-            response = [
-                TextContent(
-                    type="text",
-                    text=f"Sketch '{res['sketch_name']}' created on {plane} plane. "
-                         f"Use add_sketch_geometry to add shapes."
-                )
-            ]
-            return add_screenshot_if_available(response, screenshot)
-        else:
-            response = [
-                TextContent(type="text", text=f"Failed to create sketch: {res['error']}")
-            ]
-            return add_screenshot_if_available(response, screenshot)
-    except Exception as e:
-        logger.error(f"Failed to create sketch: {str(e)}")
-        return [
-            TextContent(type="text", text=f"Failed to create sketch: {str(e)}")
-        ]
+    return screenshot_tool_response(
+        "create sketch",
+        lambda res: (
+            f"Sketch '{res['sketch_name']}' created on {plane} plane. "
+            f"Use add_sketch_geometry to add shapes."
+        ),
+        "create_sketch", doc_name, name, plane, origin, body_name
+    )
 
 
 @mcp.tool()
@@ -1286,31 +1313,15 @@ def add_sketch_geometry(
         }
         ```
     """
-    freecad = get_freecad_connection()
-    try:
-        res = freecad.add_sketch_geometry(doc_name, sketch_name, geometry, construction)
-        screenshot = freecad.get_active_screenshot()
-
-        if res["success"]:
-            response = [
-                TextContent(
-                    type="text",
-                    text=f"Added {len(res['geometry_ids'])} geometry elements. "
-                         f"IDs: {res['geometry_ids']}. "
-                         f"Use these IDs with add_sketch_constraints if needed."
-                )
-            ]
-            return add_screenshot_if_available(response, screenshot)
-        else:
-            response = [
-                TextContent(type="text", text=f"Failed to add geometry: {res['error']}")
-            ]
-            return add_screenshot_if_available(response, screenshot)
-    except Exception as e:
-        logger.error(f"Failed to add geometry: {str(e)}")
-        return [
-            TextContent(type="text", text=f"Failed to add geometry: {str(e)}")
-        ]
+    return screenshot_tool_response(
+        "add geometry",
+        lambda res: (
+            f"Added {len(res['geometry_ids'])} geometry elements. "
+            f"IDs: {res['geometry_ids']}. "
+            f"Use these IDs with add_sketch_constraints if needed."
+        ),
+        "add_sketch_geometry", doc_name, sketch_name, geometry, construction
+    )
 
 
 @mcp.tool()
@@ -1367,29 +1378,11 @@ def add_sketch_constraints(
         }
         ```
     """
-    freecad = get_freecad_connection()
-    try:
-        res = freecad.add_sketch_constraints(doc_name, sketch_name, constraints)
-        screenshot = freecad.get_active_screenshot()
-
-        if res["success"]:
-            response = [
-                TextContent(
-                    type="text",
-                    text=f"Added {res['constraint_count']} constraints to sketch '{sketch_name}'."
-                )
-            ]
-            return add_screenshot_if_available(response, screenshot)
-        else:
-            response = [
-                TextContent(type="text", text=f"Failed to add constraints: {res['error']}")
-            ]
-            return add_screenshot_if_available(response, screenshot)
-    except Exception as e:
-        logger.error(f"Failed to add constraints: {str(e)}")
-        return [
-            TextContent(type="text", text=f"Failed to add constraints: {str(e)}")
-        ]
+    return screenshot_tool_response(
+        "add constraints",
+        lambda res: f"Added {res['constraint_count']} constraints to sketch '{sketch_name}'.",
+        "add_sketch_constraints", doc_name, sketch_name, constraints
+    )
 
 
 @mcp.tool()
@@ -1443,32 +1436,58 @@ def create_extrusion(
         }
         ```
     """
-    freecad = get_freecad_connection()
-    try:
-        res = freecad.create_extrusion(
-            doc_name, name, sketch_name, length, symmetric, reversed, body_name
-        )
-        screenshot = freecad.get_active_screenshot()
+    return screenshot_tool_response(
+        "create extrusion",
+        lambda res: (
+            f"Extrusion '{res['object_name']}' created successfully "
+            f"(length={length}mm, symmetric={symmetric})"
+        ),
+        "create_extrusion",
+        doc_name, name, sketch_name, length, symmetric, reversed, body_name
+    )
 
-        if res["success"]:
-            response = [
-                TextContent(
-                    type="text",
-                    text=f"Extrusion '{res['object_name']}' created successfully "
-                         f"(length={length}mm, symmetric={symmetric})"
-                )
-            ]
-            return add_screenshot_if_available(response, screenshot)
-        else:
-            response = [
-                TextContent(type="text", text=f"Failed to create extrusion: {res['error']}")
-            ]
-            return add_screenshot_if_available(response, screenshot)
-    except Exception as e:
-        logger.error(f"Failed to create extrusion: {str(e)}")
-        return [
-            TextContent(type="text", text=f"Failed to create extrusion: {str(e)}")
-        ]
+
+@mcp.tool()
+def build_feature(
+    ctx: Context,
+    doc_name: str,
+    sketch: dict[str, Any],
+    geometry: list[dict[str, Any]] = None,
+    constraints: list[dict[str, Any]] = None,
+    extrusion: dict[str, Any] = None
+) -> list[TextContent | ImageContent]:
+    """Create a sketch, add geometry and constraints, and pad it in one call.
+
+    Equivalent to create_sketch + add_sketch_geometry + add_sketch_constraints +
+    create_extrusion, but the document is recomputed only once at the end.
+
+    Args:
+        doc_name: The name of the document.
+        sketch: Sketch settings: {"name", "plane", "origin": {x, y, z}, "body_name"}.
+            Only "name" is required.
+        geometry: Optional geometry list, same format as add_sketch_geometry.
+        constraints: Optional constraint list, same format as add_sketch_constraints.
+        extrusion: Optional pad settings: {"name", "length", "symmetric", "reversed"}.
+
+    Returns:
+        A message indicating success or failure and a screenshot.
+
+    Examples:
+        A 20x10 plate padded 5mm:
+        ```json
+        {
+            "doc_name": "MyDocument",
+            "sketch": {"name": "PlateSketch", "plane": "XY"},
+            "geometry": [{"type": "rectangle", "x": 0, "y": 0, "width": 20, "height": 10}],
+            "extrusion": {"name": "Plate", "length": 5}
+        }
+        ```
+    """
+    return screenshot_tool_response(
+        "build feature",
+        lambda res: f"Feature built successfully: {dumps_json(res)}",
+        "build_feature", doc_name, sketch, geometry, constraints, extrusion
+    )
 
 
 @mcp.tool()
@@ -1572,35 +1591,85 @@ def create_2020_extrusion(
         }
         ```
     """
+    position = (position_x, position_y, position_z)
+    color = (color_r, color_g, color_b, color_a)
+
+    return screenshot_tool_response(
+        "create 2020 extrusion",
+        lambda res: (
+            f"2020 extrusion '{res['object_name']}' created successfully "
+            f"(length={length}mm along {direction} axis)"
+        ),
+        "create_2020_extrusion",
+        doc_name, name, length, position, direction, color, simplified,
+        profile_variant, sealed_rotation
+    )
+
+
+@mcp.tool()
+def create_2020_extrusions(
+    ctx: Context,
+    doc_name: str,
+    extrusions: list[dict[str, Any]]
+) -> list[TextContent | ImageContent]:
+    """Create several 2020 aluminum extrusion profiles in one operation.
+
+    Much faster than calling create_2020_extrusion once per member when
+    building a frame: everything is created in one pass and the document is
+    recomputed once.
+
+    Args:
+        doc_name: The name of the document to create the extrusions in.
+        extrusions: One dict per extrusion with these keys:
+            - name (required): The name for the extrusion object.
+            - length (required): Extrusion length in mm.
+            - position: {"x", "y", "z"} position (default: origin).
+            - direction: "X", "Y", or "Z" (default: "Z").
+            - color: RGBA list, e.g. [0.1, 0.1, 0.1, 1.0] (default: aluminum gray).
+            - simplified: Simple box if true, T-slot profile if false (default: true).
+            - profile_variant: "2020", "2020N1", "2020N2" or "2020N3" (default: "2020").
+            - sealed_rotation: 0, 90, 180 or 270 (default: 0).
+
+    Returns:
+        A message per extrusion and a screenshot.
+
+    Examples:
+        Create two vertical posts and a cross member:
+        ```json
+        {
+            "doc_name": "MiniRack_Assembly_6U",
+            "extrusions": [
+                {"name": "VerticalPost_FL", "length": 266.7, "position": {"x": 0, "y": 0, "z": 20}},
+                {"name": "VerticalPost_FR", "length": 266.7, "position": {"x": 242.25, "y": 0, "z": 20}},
+                {"name": "CrossMember_Front_Top", "length": 222.25,
+                 "position": {"x": 20, "y": 0, "z": 286.7}, "direction": "X"}
+            ]
+        }
+        ```
+    """
     freecad = get_freecad_connection()
     try:
-        position = {"x": position_x, "y": position_y, "z": position_z}
-        color = [color_r, color_g, color_b, color_a]
-        
-        res = freecad.create_2020_extrusion(
-            doc_name, name, length, position, direction, color, simplified,
-            profile_variant, sealed_rotation
+        res, screenshot = freecad.call_with_screenshot(
+            "create_2020_extrusions", doc_name, extrusions, screenshot=not _only_text_feedback
         )
-        screenshot = freecad.get_active_screenshot()
 
         if res["success"]:
-            response = [
-                TextContent(
-                    type="text",
-                    text=f"2020 extrusion '{res['object_name']}' created successfully "
-                         f"(length={length}mm along {direction} axis)"
-                )
-            ]
-            return add_screenshot_if_available(response, screenshot)
+            lines = [res["message"]]
+            for spec, item in zip(extrusions, res["results"]):
+                if item["success"]:
+                    lines.append(f"- '{item['object_name']}': {item['message']}")
+                else:
+                    lines.append(f"- '{spec.get('name')}' failed: {item['error']}")
+            response = [TextContent(type="text", text="\n".join(lines))]
         else:
             response = [
-                TextContent(type="text", text=f"Failed to create 2020 extrusion: {res['error']}")
+                TextContent(type="text", text=f"Failed to create 2020 extrusions: {res['error']}")
             ]
-            return add_screenshot_if_available(response, screenshot)
-    except Exception as e:
-        logger.error(f"Failed to create 2020 extrusion: {str(e)}")
+        return add_screenshot_if_available(response, screenshot)
+    except RPC_ERRORS as e:
+        logger.error("Failed to create 2020 extrusions: %s", e)
         return [
-            TextContent(type="text", text=f"Failed to create 2020 extrusion: {str(e)}")
+            TextContent(type="text", text=f"Failed to create 2020 extrusions: {str(e)}")
         ]
 
 
@@ -1666,45 +1735,72 @@ def batch_position(
         }
         ```
     """
-    freecad = get_freecad_connection()
-    try:
-        offset = {"x": offset_x, "y": offset_y, "z": offset_z}
-        position = None
-        if absolute:
-            position = {}
-            if position_x is not None:
-                position["x"] = position_x
-            if position_y is not None:
-                position["y"] = position_y
-            if position_z is not None:
-                position["z"] = position_z
-        
-        res = freecad.batch_position(doc_name, objects, offset, position, absolute)
-        screenshot = freecad.get_active_screenshot()
+    offset = {"x": offset_x, "y": offset_y, "z": offset_z}
+    position = None
+    if absolute:
+        position = {}
+        if position_x is not None:
+            position["x"] = position_x
+        if position_y is not None:
+            position["y"] = position_y
+        if position_z is not None:
+            position["z"] = position_z
+
+    return screenshot_tool_response(
+        "batch update positions",
+        lambda res: f"Batch position update: {res['message']}",
+        "batch_position", doc_name, objects, offset, position, absolute
+    )
 
-        if res["success"]:
-            response = [
-                TextContent(
-                    type="text",
-                    text=f"Batch position update: {res['message']}"
-                )
-            ]
-            return add_screenshot_if_available(response, screenshot)
-        else:
-            response = [
-                TextContent(type="text", text=f"Failed to batch update positions: {res['error']}")
-            ]
-            return add_screenshot_if_available(response, screenshot)
-    except Exception as e:
-        logger.error(f"Failed to batch update positions: {str(e)}")
-        return [
-            TextContent(type="text", text=f"Failed to batch update positions: {str(e)}")
-        ]
 
+@mcp.tool()
+def batch_set_positions(
+    ctx: Context,
+    doc_name: str,
+    objects: list[str],
+    xs: list[float],
+    ys: list[float],
+    zs: list[float],
+    rotations: list[list[float]] = None
+) -> list[TextContent | ImageContent]:
+    """Give each of several objects its own position in a single operation.
 
-@mcp.prompt()
-def asset_creation_strategy() -> str:
-    return """
+    Unlike batch_position, which applies one offset or position to every
+    object, this takes parallel coordinate lists so each object can land
+    somewhere different.
+
+    Args:
+        doc_name: The name of the document containing the objects.
+        objects: List of object names to reposition.
+        xs: X coordinate for each object, in the same order as objects.
+        ys: Y coordinate for each object, in the same order as objects.
+        zs: Z coordinate for each object, in the same order as objects.
+        rotations: Optional rotation per object as a quaternion [x, y, z, w].
+            Objects keep their current rotation when omitted.
+
+    Returns:
+        A message with update count and a screenshot.
+
+    Examples:
+        Lay out three trays along X:
+        ```json
+        {
+            "doc_name": "MiniRack_Assembly_6U",
+            "objects": ["Tray1_Assembly", "Tray2_Assembly", "Tray3_Assembly"],
+            "xs": [0, 120, 240],
+            "ys": [0, 0, 0],
+            "zs": [10, 10, 10]
+        }
+        ```
+    """
+    return screenshot_tool_response(
+        "set positions",
+        lambda res: f"Batch position update: {res['message']}",
+        "batch_set_positions", doc_name, objects, xs, ys, zs, rotations
+    )
+
+
+_ASSET_CREATION_STRATEGY = """
 Asset Creation Strategy for FreeCAD MCP
 
 When creating content in FreeCAD, always follow these steps:
@@ -1734,13 +1830,45 @@ Only revert to basic creation methods in the following cases:
 """
 
 
+@mcp.prompt()
+def asset_creation_strategy() -> str:
+    return _ASSET_CREATION_STRATEGY
+
+
 def main():
     """Run the MCP server"""
-    global _only_text_feedback
+    global _only_text_feedback, _screenshot_debounce_ms, _screenshot_max_dim, _screenshot_format
     import argparse
+
+    # Configure logging here rather than at import, so importing the module
+    # leaves the host's logging setup alone
+    logging.basicConfig(
+        level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+    )
     parser = argparse.ArgumentParser()
     parser.add_argument("--only-text-feedback", action="store_true", help="Only return text feedback")
+    parser.add_argument(
+        "--screenshot-debounce-ms",
+        type=int,
+        default=_screenshot_debounce_ms,
+        help="Reuse a screenshot taken within this many milliseconds instead of rendering again (0 disables)",
+    )
+    parser.add_argument(
+        "--screenshot-max-dim",
+        type=int,
+        default=_screenshot_max_dim,
+        help="Scale screenshots down so neither side exceeds this many pixels (0 keeps full size)",
+    )
+    parser.add_argument(
+        "--screenshot-format",
+        choices=sorted(SCREENSHOT_MIME_TYPES),
+        default=_screenshot_format,
+        help="Image format of screenshots; jpeg is much smaller than png",
+    )
     args = parser.parse_args()
     _only_text_feedback = args.only_text_feedback
-    logger.info(f"Only text feedback: {_only_text_feedback}")
+    _screenshot_debounce_ms = args.screenshot_debounce_ms
+    _screenshot_max_dim = args.screenshot_max_dim
+    _screenshot_format = args.screenshot_format
+    logger.info("Only text feedback: %s", _only_text_feedback)
     mcp.run()
\ No newline at end of file